@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+from datetime import date
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+from scraper.core.backfill import (
+    DEFAULT_BATCH_SIZE, DEFAULT_CHECKPOINT, DEFAULT_RATE, DEFAULT_SHARD_SIZE, DEFAULT_WORKERS,
+    date_shards, page_shards, run_backfill,
+)
+from scraper.core.database import Database, get_db
+
+def main():
+    parser = argparse.ArgumentParser(description="과거 게시물 병렬 백필 (중단 시 체크포인트로 재개)")
+    parser.add_argument('--pages', help="/new 목록 페이지 범위 (예: 1-500)")
+    parser.add_argument('--dates', help="날짜 범위 (예: 2025-01-01:2025-03-31)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="파싱 프로세스 수")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help="페이지 범위 샤드당 페이지 수")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help="전체 초당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="한 트랜잭션에 저장할 게시물 수")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help="체크포인트 파일 경로")
+    parser.add_argument('--reset-checkpoint', action='store_true',
+                        help="기존 체크포인트를 무시하고 처음부터 실행 (다른 작업의 체크포인트일 때)")
+    parser.add_argument('--db', default=None, help="저장할 DB 경로 (기본: database/scraper.db)")
+    parser.add_argument('--target-url', default=None,
+                        help="대상 URL (기본: TARGET_URL 환경변수, 지정하면 이 URL의 호스트에서 수집)")
+    parser.add_argument('--translate', action='store_true', help="설명 번역 수행 (API 사용량 주의)")
+    parser.add_argument('--verbose', action='store_true', help="작업자의 페이지별 출력 표시")
+    args = parser.parse_args()
+
+    load_dotenv()
+    target_url = args.target_url or os.getenv('TARGET_URL')
+    if not target_url:
+        print("❌ Error: TARGET_URL 환경변수가 설정되어 있지 않습니다.")
+        sys.exit(1)
+    # 목업 사이트 등 다른 호스트는 --target-url로 지정한 경우에만 사용
+    base_url = None
+    if args.target_url:
+        parsed = urlparse(args.target_url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else None
+    if bool(args.pages) == bool(args.dates):
+        parser.error("--pages와 --dates 중 하나를 지정하세요.")
+    if args.pages:
+        first, _, last = args.pages.partition('-')
+        shards = page_shards(int(first), int(last or first), args.shard_size)
+    else:
+        start, _, end = args.dates.partition(':')
+        shards = date_shards(date.fromisoformat(start), date.fromisoformat(end or start))
+
+    db = Database(args.db) if args.db else get_db()
+    try:
+        print(f"🚚 백필 시작: 샤드 {len(shards)}개, 작업자 {args.workers}개, 초당 {args.rate}회 요청")
+        stats = run_backfill(target_url, shards, workers=args.workers, rate=args.rate,
+                             batch_size=args.batch_size, checkpoint_path=args.checkpoint, db=db,
+                             translate=args.translate, verbose=args.verbose, base_url=base_url,
+                             reset_checkpoint=args.reset_checkpoint)
+    finally:
+        db.close()
+
+    print(f"🧩 샤드: 완료 {stats['completed']}개, 건너뜀 {stats['skipped']}개, 실패 {len(stats['failed'])}개")
+    print(f"📄 페이지: {stats['pages']}개 ({stats['pages'] / max(stats['elapsed'], 1e-9):.1f} pages/sec)")
+    print(f"💾 게시물: {stats['posts']}개 (저장/갱신 {stats['written']}개, DB 시간 {stats['db_time']:.2f}초)")
+    print(f"⏳ 소요 시간: {stats['elapsed']:.1f}초")
+    if stats['failed']:
+        print(f"⚠️ 실패한 샤드는 같은 명령을 다시 실행하면 이어서 처리됩니다: {', '.join(stats['failed'])}")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,77 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from scraper.core.database import Database
+from scraper.core.scraper import Scraper
+from scraper.utils.mock_site import MockSite
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 메모리 사용량 (MB, 측정 불가 시 0)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="목업 사이트를 대상으로 스크래퍼 전체 처리량 측정")
+    parser.add_argument('--pages', type=int, default=50, help="생성할 페이지 수")
+    parser.add_argument('--per-page', type=int, default=10, help="페이지당 게시물 수")
+    parser.add_argument('--latency-ms', type=float, default=0, help="응답 지연 시간 (ms)")
+    parser.add_argument('--error-rate', type=float, default=0, help="500 오류 응답 비율 (0~1)")
+    parser.add_argument('--duplicate-ratio', type=float, default=0, help="중복 게시물 비율 (0~1)")
+    parser.add_argument('--seed', type=int, default=0, help="게시물 생성 시드")
+    parser.add_argument('--db', default=None, help="결과를 저장할 DB 경로 (기본: 임시 파일)")
+    parser.add_argument('--port', type=int, default=0,
+                        help="목업 서버 포트 (게시물 URL에 포함되므로 --db 재사용 시 고정, 기본: 자동)")
+    parser.add_argument('--selenium', action='store_true', help="HTTP 대신 Selenium으로 요청")
+    parser.add_argument('--translate', action='store_true', help="DeepL 번역 수행 (API 사용량 주의)")
+    parser.add_argument('--verbose', action='store_true', help="스크래퍼 출력 표시")
+    parser.add_argument('--profile', action='store_true', help="cProfile/tracemalloc 결과를 logs/에 저장")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            MockSite(args.pages, args.per_page, args.latency_ms / 1000, args.error_rate,
+                     args.duplicate_ratio, args.seed, port=args.port) as site:
+        db = Database(args.db or os.path.join(tmp_dir, "load_test.db"))
+        scraper = Scraper(f"{site.url}/new", use_selenium=args.selenium, db=db, translate=args.translate,
+                          base_url=site.url)
+        print(f"🧪 목업 서버: {site.url}/new ({args.pages}페이지 x {args.per_page}개)")
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        try:
+            start_time = time.perf_counter()
+            if args.profile:
+                from scraper.utils.profiler import profile_run
+                profiling = profile_run(f"load_test_{time.strftime('%Y%m%d_%H%M%S')}")
+            else:
+                profiling = contextlib.nullcontext()
+            with profiling:
+                with output:
+                    stats = scraper.scrape_new_posts()
+            elapsed = time.perf_counter() - start_time
+        finally:
+            scraper.close()
+            db.close()
+
+    print(f"📄 페이지: {stats['pages']}개 ({stats['pages'] / elapsed:.1f} pages/sec, "
+          f"재시도 후 실패 {stats['failed_pages']}개)")
+    print(f"📝 게시물: {stats['posts']}개 ({stats['posts'] / elapsed:.1f} posts/sec)")
+    print(f"💾 저장: {stats['saved']}개 (변경 반영 {stats['updated']}개, 중복 {stats['posts'] - stats['saved']}개)")
+    print(f"🌐 요청 시간: {stats['fetch_time']:.2f}초 (요청 {site.requests_served}회, 오류 {site.errors_served}회)")
+    print(f"🗄️ DB 커밋 시간: {stats['db_time']:.2f}초 "
+          f"(게시물당 {stats['db_time'] / max(stats['posts'], 1) * 1000:.2f}ms)")
+    print(f"🧠 최대 메모리: {peak_rss_mb():.1f}MB")
+    print(f"⏳ 전체 소요 시간: {elapsed:.2f}초")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,40 @@
+import argparse
+import sys
+from dotenv import load_dotenv
+from scraper.core.database import get_db
+from scraper.core.maintenance import run_maintenance
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터베이스 유지보수")
+    parser.add_argument('--archive-after-days', type=int, default=None,
+                        help="이 일수보다 오래된 게시물을 아카이브 DB(posts_archive.db)로 이동 (0이면 이동 안 함)")
+    parser.add_argument('--rebuild-stats', action='store_true',
+                        help="전체 게시물로 일별 집계 테이블을 다시 생성 "
+                             "(--archive-after-days 없이 지정하면 유지보수 작업은 실행하지 않음)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    db = get_db()
+    try:
+        # --rebuild-stats만 지정하면 VACUUM 등 전체 유지보수 없이 집계만 다시 생성
+        if not args.rebuild_stats or args.archive_after_days is not None:
+            result = run_maintenance(db, archive_after_days=args.archive_after_days)
+            print(f"🧹 삭제된 인덱스: {', '.join(result['dropped_indexes']) or '없음'}")
+            print(f"📦 아카이브된 게시물: {result['archived_posts']}개 (아카이브 DB: {result['archives']}개)")
+            if result['rebuilt_stats']:
+                print(f"📊 일별 집계 생성: {result['rebuilt_stats']}개 게시물")
+            print(f"♻️ 반환된 페이지: {result['freed_pages']}개")
+            print(f"⏳ 소요 시간: {result['elapsed']:.1f}초")
+        if args.rebuild_stats:
+            count = db.rebuild_daily_stats()
+            db.notify_readers()
+            print(f"📊 일별 집계 재생성: {count}개 게시물")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
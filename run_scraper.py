@@ -1,22 +1,47 @@
 import os
+import sys
+import argparse
+import contextlib
 from dotenv import load_dotenv
 from scraper.core.scraper import Scraper
 from scraper.core.database import init_db
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OneJAV 스크래퍼 실행")
+    parser.add_argument('--http', action='store_true',
+                        help="Selenium 없이 HTTP 요청만으로 페이지를 가져옴")
+    parser.add_argument('--profile', action='store_true',
+                        help="cProfile/tracemalloc 결과를 logs/에 저장하고 요약 출력")
+    args = parser.parse_args()
+
     load_dotenv()
     db = init_db()
     target_url = os.getenv('TARGET_URL')
     if not target_url:
         print("❌ Error: TARGET_URL 환경변수가 설정되어 있지 않습니다.")
         exit(1)
-    scraper = Scraper(target_url)
+    scraper = Scraper(target_url, use_selenium=not args.http)
+    exit_code = 0
     try:
         print("🚀 실제 스크래핑을 시작합니다...")
-        scraper.scrape_new_posts()
-        print("✨ 스크래핑이 완료되었습니다.")
+        if args.profile:
+            from scraper.utils.profiler import profile_run
+            profiling = profile_run()
+        else:
+            profiling = contextlib.nullcontext()
+        with profiling:
+            stats = scraper.scrape_new_posts()
+        if stats['failed_pages']:
+            # 수집한 게시물까지만 저장된 상태이므로 스케줄러가 실패로 기록하도록 0이 아닌 값으로 종료
+            print(f"❌ 페이지 {stats['failed_pages']}개를 가져오지 못해 스크래핑이 중단되었습니다. "
+                  f"(가져온 페이지 {stats['pages']}개, 저장된 게시물 {stats['saved']}개)")
+            exit_code = 1
+        else:
+            print("✨ 스크래핑이 완료되었습니다.")
     except Exception as e:
         print(f"❌ 스크래핑 중 오류 발생: {str(e)}")
+        exit_code = 1
     finally:
         scraper.close()
-        db.close() 
\ No newline at end of file
+        db.close()
+    sys.exit(exit_code)
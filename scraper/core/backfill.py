@@ -0,0 +1,240 @@
+"""
+과거 게시물 대량 수집(백필) 모듈
+
+이 모듈은 페이지 범위 또는 날짜 범위를 샤드로 나누어 여러 프로세스에서
+병렬로 파싱하고, 결과를 단일 작성자(부모 프로세스)가 일괄 저장합니다.
+
+주요 기능:
+- 페이지/날짜 범위 샤드 분할
+- 프로세스 풀 파싱 (모든 프로세스가 하나의 요청 속도 제한 공유)
+- 샤드 단위 일괄 저장과 체크포인트 파일 기반 재개
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+from scraper.core.database import Database, get_db
+from scraper.core.models import PostRecord
+from scraper.utils.logger import get_logger
+from scraper.utils.user_agent import SharedRateLimiter
+
+# 기본 설정
+DEFAULT_WORKERS = 4
+DEFAULT_SHARD_SIZE = 10  # 페이지 범위 샤드당 페이지 수
+DEFAULT_RATE = 2.0  # 전체 프로세스 합계 초당 요청 수
+DEFAULT_BATCH_SIZE = 500  # 한 트랜잭션에 저장할 게시물 수
+MAX_DATE_PAGES = 200  # 날짜 샤드 하나에서 따라갈 최대 페이지 수
+DEFAULT_CHECKPOINT = os.path.join("database", "backfill_checkpoint.json")
+
+# 샤드: (샤드 ID, 종류('pages' 또는 'date'), 인자)
+Shard = Tuple[str, str, Any]
+
+logger = get_logger(__name__)
+
+# 작업자 프로세스별 스크래퍼 (initializer에서 생성)
+_worker_scraper = None
+
+
+def page_shards(start_page: int, end_page: int, shard_size: int = DEFAULT_SHARD_SIZE) -> List[Shard]:
+    """/new 목록의 페이지 범위를 shard_size 페이지씩 나눈 샤드 목록"""
+    shards = []
+    for first in range(start_page, end_page + 1, shard_size):
+        last = min(first + shard_size - 1, end_page)
+        shards.append((f"pages:{first}-{last}", 'pages', (first, last)))
+    return shards
+
+
+def date_shards(start: date, end: date) -> List[Shard]:
+    """날짜 범위를 하루 단위로 나눈 샤드 목록 (최신 날짜부터)"""
+    shards = []
+    day = end
+    while day >= start:
+        shards.append((f"date:{day.isoformat()}", 'date', day.isoformat()))
+        day -= timedelta(days=1)
+    return shards
+
+
+def backfill_job(target_url: str, shards: List[Shard], base_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    체크포인트가 같은 백필 작업의 것인지 확인하기 위한 작업 정보 (대상, 종류, 범위)
+
+    /new 목록은 새 게시물이 올라올 때마다 페이지가 뒤로 밀리므로,
+    페이지 범위 작업은 시작한 날짜도 포함해 다른 날에는 이어서 실행하지 않습니다.
+    """
+    kinds = sorted({kind for _, kind, _ in shards})
+    job: Dict[str, Any] = {'target_url': target_url, 'base_url': base_url, 'kind': '+'.join(kinds)}
+    if kinds == ['pages']:
+        job['range'] = f"{min(arg[0] for _, _, arg in shards)}-{max(arg[1] for _, _, arg in shards)}"
+        job['date'] = date.today().isoformat()
+    elif kinds == ['date']:
+        days = sorted(arg for _, _, arg in shards)
+        job['range'] = f"{days[0]}:{days[-1]}"
+    else:
+        job['range'] = [shard_id for shard_id, _, _ in shards]
+    return job
+
+
+def load_checkpoint(path: str, job: Optional[Dict[str, Any]] = None) -> Set[str]:
+    """
+    체크포인트 파일에서 완료된 샤드 ID 목록을 읽음
+
+    Raises:
+        ValueError: job을 주었고 체크포인트가 다른 작업(대상/종류/범위/페이지 작업 날짜)의 것일 때
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if job is not None and data.get('job') != job:
+        raise ValueError(
+            f"체크포인트가 다른 백필 작업의 것입니다: {path} "
+            f"(기록된 작업: {data.get('job')}, 현재 작업: {job}). "
+            f"다른 체크포인트 경로를 지정하거나 체크포인트를 초기화하세요."
+        )
+    return set(data.get('done', []))
+
+
+def save_checkpoint(path: str, done: Set[str], job: Optional[Dict[str, Any]] = None):
+    """완료된 샤드 ID 목록을 작업 정보와 함께 체크포인트 파일에 원자적으로 기록"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'job': job, 'done': sorted(done),
+                   'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _init_worker(target_url: str, base_url: Optional[str], rate_limiter: SharedRateLimiter,
+                 translate: bool, verbose: bool):
+    """작업자 프로세스 초기화 (HTTP 요청만 사용, DB는 열지 않음)"""
+    global _worker_scraper
+    from scraper.core.scraper import Scraper
+    _worker_scraper = Scraper(target_url, use_selenium=False, translate=translate,
+                              rate_limiter=rate_limiter, base_url=base_url)
+    if not verbose:
+        # 작업자의 페이지별 출력은 버림 (요약은 부모 프로세스가 출력)
+        sys.stdout = open(os.devnull, 'w')
+
+
+def _parse_shard(shard: Shard) -> Tuple[Shard, List[PostRecord], int, Optional[str]]:
+    """
+    작업자 프로세스에서 샤드 하나를 가져와 파싱
+
+    Returns:
+        (샤드, 게시물 목록, 요청한 페이지 수, 오류 메시지 또는 None)
+    """
+    scraper = _worker_scraper
+    _, kind, arg = shard
+    posts: List[PostRecord] = []
+    pages = 0
+    try:
+        if kind == 'pages':
+            first, last = arg
+            urls = [f"{scraper.base_url}/new" if p == 1 else f"{scraper.base_url}/new?page={p}"
+                    for p in range(first, last + 1)]
+            for url in urls:
+                try:
+                    soup = scraper.get_page(url)
+                except Exception as e:
+                    if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                        break  # 마지막 페이지 이후
+                    raise
+                pages += 1
+                cards = soup.find_all('div', class_='card mb-3')
+                if not cards:
+                    break  # 마지막 페이지 이후
+                posts.extend(p for p in map(scraper.process_card, cards) if p)
+        else:
+            url = f"{scraper.base_url}/{arg.replace('-', '/')}"
+            while url and pages < MAX_DATE_PAGES:
+                soup = scraper.get_page(url)
+                pages += 1
+                cards = soup.find_all('div', class_='card mb-3')
+                posts.extend(p for p in map(scraper.process_card, cards) if p)
+                url = scraper.get_next_page_url(soup, url)
+        if scraper.translate:
+            from scraper.utils.trans_desc import translate_to_korean
+            for post in posts:
+                if post.description:
+                    try:
+                        post.translated_desc = translate_to_korean(post.description)
+                    except Exception as e:
+                        logger.warning(f"번역 오류 ({post.code}): {str(e)}")
+        return shard, posts, pages, None
+    except Exception as e:
+        return shard, posts, pages, str(e)
+
+
+def run_backfill(target_url: str, shards: List[Shard], workers: int = DEFAULT_WORKERS,
+                 rate: float = DEFAULT_RATE, batch_size: int = DEFAULT_BATCH_SIZE,
+                 checkpoint_path: str = DEFAULT_CHECKPOINT, db: Optional[Database] = None,
+                 translate: bool = False, verbose: bool = False,
+                 base_url: Optional[str] = None, reset_checkpoint: bool = False) -> Dict[str, Any]:
+    """
+    샤드를 프로세스 풀에서 파싱하고 부모 프로세스가 단일 작성자로 저장합니다.
+
+    샤드는 게시물이 모두 커밋된 뒤에만 체크포인트에 기록되므로,
+    중단 후 같은 체크포인트로 다시 실행하면 남은 샤드만 처리합니다.
+    체크포인트가 다른 작업의 것이면 (backfill_job() 참고) ValueError가 발생합니다.
+
+    Args:
+        target_url: 대상 사이트 URL
+        shards: page_shards() 또는 date_shards()로 만든 샤드 목록
+        workers: 파싱 프로세스 수
+        rate: 모든 프로세스 합계 초당 최대 요청 수
+        batch_size: 한 트랜잭션에 저장할 게시물 수
+        checkpoint_path: 체크포인트 파일 경로
+        db: 저장할 Database (없으면 기본 인스턴스)
+        translate: 작업자에서 설명 번역 수행 여부
+        verbose: 작업자의 페이지별 출력 표시 여부
+        base_url: 목록 URL의 기준 URL (없으면 스크래퍼 기본값)
+        reset_checkpoint: True이면 기존 체크포인트를 무시하고 처음부터 실행
+
+    Returns:
+        Dict[str, Any]: 실행 통계
+    """
+    db = db if db is not None else get_db()
+    job = backfill_job(target_url, shards, base_url)
+    done = set() if reset_checkpoint else load_checkpoint(checkpoint_path, job)
+    pending = [shard for shard in shards if shard[0] not in done]
+    stats = {'shards': len(shards), 'skipped': len(shards) - len(pending), 'completed': 0,
+             'failed': [], 'pages': 0, 'posts': 0, 'written': 0, 'db_time': 0.0}
+    logger.info(f"백필 시작: 샤드 {len(pending)}개 (완료된 샤드 {stats['skipped']}개 건너뜀)")
+
+    start_time = time.time()
+    rate_limiter = SharedRateLimiter(rate)
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(target_url, base_url, rate_limiter, translate, verbose)) as pool:
+        for shard, posts, pages, error in pool.imap_unordered(_parse_shard, pending):
+            stats['pages'] += pages
+            if error is not None:
+                stats['failed'].append(shard[0])
+                logger.error(f"샤드 실패 ({shard[0]}): {error}")
+                continue
+            db_start = time.perf_counter()
+            try:
+                for i in range(0, len(posts), batch_size):
+                    stats['written'] += db.upsert_posts(posts[i:i + batch_size])
+            except Exception as e:
+                # 체크포인트에 기록하지 않으므로 다음 실행에서 다시 처리됨
+                stats['failed'].append(shard[0])
+                logger.error(f"샤드 저장 실패 ({shard[0]}): {str(e)}")
+                continue
+            finally:
+                stats['db_time'] += time.perf_counter() - db_start
+            stats['posts'] += len(posts)
+            stats['completed'] += 1
+            done.add(shard[0])
+            save_checkpoint(checkpoint_path, done, job)
+            logger.info(f"샤드 완료 ({shard[0]}): 페이지 {pages}개, 게시물 {len(posts)}개 "
+                        f"[{stats['completed']}/{len(pending)}]")
+    if stats['written']:
+        db.notify_readers()
+    stats['elapsed'] = time.time() - start_time
+    logger.info(f"백필 완료: 게시물 {stats['posts']}개 (저장/갱신 {stats['written']}개), "
+                f"실패 샤드 {len(stats['failed'])}개 ({stats['elapsed']:.1f}초)")
+    return stats
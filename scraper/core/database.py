@@ -6,13 +6,123 @@
 
 import sqlite3
 import json
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 import os
+from urllib.parse import quote
+from scraper.core.models import PostRecord, POST_COLUMNS, CONTENT_FIELDS, row_content_hash
 from scraper.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 재스크래핑 시 갱신하는 컬럼 (id, url, views는 유지)
+_UPDATE_COLUMNS = tuple(c for c in POST_COLUMNS if c not in ('url', 'views'))
+
+# main DB 게시물 UPSERT: content_hash가 같으면 아무것도 쓰지 않음
+_UPSERT_POST_SQL = (
+    f"INSERT INTO main.posts ({', '.join(POST_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(POST_COLUMNS))}) "
+    f"ON CONFLICT(url) DO UPDATE SET "
+    f"{', '.join(f'{c} = excluded.{c}' for c in _UPDATE_COLUMNS)} "
+    f"WHERE posts.content_hash IS NOT excluded.content_hash"
+)
+
+# 아카이브 DB 게시물 갱신 ({schema}에 아카이브 별칭이 들어감)
+_UPDATE_POST_SQL = (
+    "UPDATE {schema}.posts SET "
+    f"{', '.join(f'{c} = ?' for c in _UPDATE_COLUMNS)} "
+    "WHERE url = ?"
+)
+
+# 게시물 변경 이력
+_POST_CHANGES_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS post_changes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT NOT NULL,
+        changed_at TIMESTAMP NOT NULL,
+        changed_fields TEXT NOT NULL,
+        old_hash TEXT,
+        new_hash TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_post_changes_url ON post_changes(url)",
+)
+
+# posts 테이블 스키마 ({schema}에 main 또는 아카이브 별칭이 들어감)
+_POSTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {schema}.posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        url TEXT UNIQUE NOT NULL,
+        code TEXT NOT NULL,
+        title TEXT NOT NULL,
+        image_url TEXT NOT NULL,
+        file_size TEXT NOT NULL,
+        post_date TIMESTAMP NOT NULL,
+        tags TEXT NOT NULL,
+        description TEXT,
+        translated_desc TEXT,
+        actress TEXT,
+        download_url TEXT NOT NULL,
+        scraped_at TIMESTAMP NOT NULL,
+        views INTEGER DEFAULT 0,
+        content_hash TEXT
+    )
+"""
+
+# url 인덱스는 UNIQUE 제약의 암묵적 인덱스와 중복되므로 만들지 않음
+_POSTS_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_posts_post_date ON posts(post_date)",
+    "CREATE INDEX IF NOT EXISTS {schema}.idx_posts_code ON posts(code)",
+)
+_REDUNDANT_INDEXES = ('idx_posts_url',)
+
+# 일별 집계 테이블 (대시보드 조회용)
+_DAILY_STATS_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        day TEXT PRIMARY KEY,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        total_size INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_tags (
+        day TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, tag)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS daily_actresses (
+        day TEXT NOT NULL,
+        actress TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, actress)
+    ) WITHOUT ROWID
+    """,
+)
+_UPSERT_DAILY_STATS_SQL = """
+    INSERT INTO daily_stats (day, post_count, total_size) VALUES (?, ?, ?)
+    ON CONFLICT(day) DO UPDATE SET
+        post_count = post_count + excluded.post_count,
+        total_size = total_size + excluded.total_size
+"""
+_UPSERT_DAILY_NAME_SQL = """
+    INSERT INTO {table} (day, {column}, post_count) VALUES (?, ?, ?)
+    ON CONFLICT(day, {column}) DO UPDATE SET
+        post_count = post_count + excluded.post_count
+"""
+
+# 아카이브 DB: 오래된 게시물을 모두 모아 두는 단일 파일
+# (SQLite는 ATTACH를 연결당 10개까지만 허용하므로 기간별 파일로 나누지 않음)
+_ARCHIVE_FILE = "posts_archive.db"
+_ARCHIVE_ALIAS = "archive"
+
+# _upsert()에 기존 게시물 조회 결과를 주지 않았음을 나타내는 값 (None은 '게시물 없음')
+_LOOKUP = object()
+
 class Database:
     def __init__(self, db_path: str = "database/scraper.db"):
         """데이터베이스 초기화"""
@@ -21,9 +131,17 @@ class Database:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
             
             self.db_path = db_path
+            self.archive_dir = os.path.join(os.path.dirname(db_path), "archive")
+            self.archive_path = os.path.join(self.archive_dir, _ARCHIVE_FILE)
+            self.archives: List[str] = []  # ATTACH된 아카이브 별칭 목록 (최대 1개)
             self.conn = sqlite3.connect(db_path)
             self.conn.row_factory = sqlite3.Row
+            # 새 DB 파일에만 적용됨 (기존 파일은 vacuum()에서 전환)
+            self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # 조회 서비스의 읽기 연결이 스크래퍼의 쓰기를 막지 않도록 WAL 사용 (파일에 유지됨)
+            self.conn.execute("PRAGMA journal_mode = WAL")
             self.create_tables()
+            self.attach_archives()
             logger.info(f"데이터베이스 초기화 완료: {db_path}")
         except Exception as e:
             logger.error(f"데이터베이스 초기화 중 오류 발생: {str(e)}")
@@ -32,78 +150,418 @@ class Database:
     def create_tables(self):
         """테이블 생성"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS posts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url TEXT UNIQUE NOT NULL,
-                    code TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    image_url TEXT NOT NULL,
-                    file_size TEXT NOT NULL,
-                    post_date TIMESTAMP NOT NULL,
-                    tags TEXT NOT NULL,
-                    description TEXT,
-                    translated_desc TEXT,
-                    actress TEXT,
-                    download_url TEXT NOT NULL,
-                    scraped_at TIMESTAMP NOT NULL,
-                    views INTEGER DEFAULT 0
-                )
-            """)
-            
-            # 인덱스 추가
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_url ON posts(url)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_post_date ON posts(post_date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_code ON posts(code)")
-            
+            self._create_posts_table("main")
+            for sql in _DAILY_STATS_SQL + _POST_CHANGES_SQL:
+                self.conn.execute(sql)
             self.conn.commit()
             logger.info("테이블 및 인덱스 생성 완료")
         except Exception as e:
             logger.error(f"테이블 생성 중 오류 발생: {str(e)}")
             raise
     
-    def add_post(self, post_data: dict) -> bool:
-        """게시물 추가"""
+    def _create_posts_table(self, schema: str):
+        """지정한 스키마(main 또는 아카이브)에 posts 테이블과 인덱스 생성"""
+        cursor = self.conn.cursor()
+        cursor.execute(_POSTS_TABLE_SQL.format(schema=schema))
+        for sql in _POSTS_INDEX_SQL:
+            cursor.execute(sql.format(schema=schema))
+        columns = [row['name'] for row in cursor.execute(f"PRAGMA {schema}.table_info(posts)")]
+        if 'content_hash' not in columns:
+            self._add_content_hash(schema)
+
+    def _add_content_hash(self, schema: str):
+        """
+        content_hash 컬럼이 없던 기존 posts 테이블에 컬럼을 추가하고 해시를 채움
+
+        sqlite3 모듈은 DDL을 트랜잭션으로 묶지 않으므로 BEGIN을 직접 실행해
+        컬럼 추가와 해시 채우기를 한 트랜잭션으로 처리합니다.
+        (중간에 실패하면 컬럼도 추가되지 않아 다음에 열 때 다시 시도)
+        """
+        self.conn.execute("BEGIN")
         try:
-            with self.conn:  # 트랜잭션 컨텍스트 매니저 사용
+            self.conn.execute(f"ALTER TABLE {schema}.posts ADD COLUMN content_hash TEXT")
+            rows = self.conn.execute(f"SELECT * FROM {schema}.posts").fetchall()
+            # 이전 버전에서 저장된 행은 PostRecord 검증을 통과하지 못할 수 있으므로 행 값으로 계산
+            self.conn.executemany(
+                f"UPDATE {schema}.posts SET content_hash = ? WHERE id = ?",
+                [(row_content_hash(row), row['id']) for row in rows]
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        logger.info(f"content_hash 컬럼 추가: {schema} ({len(rows)}개 게시물)")
+
+    def _attach_archive(self) -> str:
+        """아카이브 DB를 ATTACH하고 (없으면 생성) 별칭 반환"""
+        if _ARCHIVE_ALIAS not in self.archives:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            self.conn.execute(f"ATTACH DATABASE ? AS {_ARCHIVE_ALIAS}", (self.archive_path,))
+            self._create_posts_table(_ARCHIVE_ALIAS)
+            self.conn.commit()
+            self.archives.append(_ARCHIVE_ALIAS)
+        return _ARCHIVE_ALIAS
+
+    def _create_posts_view(self):
+        """main과 아카이브의 posts를 합친 임시 뷰(posts_all) 생성"""
+        _create_posts_view(self.conn, self.archives)
+
+    def attach_archives(self):
+        """아카이브 DB가 있으면 ATTACH하고 조회용 뷰 갱신"""
+        try:
+            if os.path.exists(self.archive_path):
+                self._attach_archive()
+                logger.info(f"아카이브 DB 연결 완료: {self.archive_path}")
+            self._create_posts_view()
+        except sqlite3.Error as e:
+            logger.error(f"아카이브 연결 중 오류 발생: {str(e)}")
+            raise
+
+    def archive_old_posts(self, older_than_days: int) -> int:
+        """
+        오래된 게시물을 아카이브 DB(posts_archive.db)에 복사한 뒤 main에서 삭제
+
+        한 트랜잭션이 너무 커지지 않도록 게시월별로 나누어 옮깁니다.
+
+        Args:
+            older_than_days: 이 일수보다 오래된 게시일의 게시물을 이동
+
+        Returns:
+            int: main DB에서 이동된 게시물 수
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat(' ')
+        moved = 0
+        try:
+            months = [row[0] for row in self.conn.execute(
+                "SELECT DISTINCT strftime('%Y%m', post_date) FROM main.posts WHERE post_date < ?",
+                (cutoff,)
+            ) if row[0]]
+            alias = self._attach_archive() if months else None
+            for month in months:
+                where = "post_date < ? AND strftime('%Y%m', post_date) = ?"
+                # WAL 모드에서는 여러 DB 파일에 걸친 커밋이 원자적이지 않으므로
+                # 아카이브 복사를 먼저 커밋하고, 아카이브에 같은 내용이 있는 행만 main에서 삭제
+                # (중간에 중단되면 main에 남은 행을 다음 실행에서 다시 옮김)
+                with self.conn:
+                    self.conn.execute(
+                        f"DELETE FROM {alias}.posts WHERE url IN (SELECT url FROM main.posts WHERE {where})",
+                        (cutoff, month)
+                    )
+                    self.conn.execute(
+                        f"INSERT OR IGNORE INTO {alias}.posts SELECT * FROM main.posts WHERE {where}",
+                        (cutoff, month)
+                    )
+                with self.conn:
+                    cursor = self.conn.execute(
+                        f"DELETE FROM main.posts WHERE {where} AND EXISTS ("
+                        f"SELECT 1 FROM {alias}.posts AS a "
+                        f"WHERE a.url = main.posts.url AND a.content_hash IS main.posts.content_hash)",
+                        (cutoff, month)
+                    )
+                    moved += cursor.rowcount
+                logger.info(f"게시물 아카이브: {month} ({cursor.rowcount}개)")
+            self._create_posts_view()
+            return moved
+        except sqlite3.Error as e:
+            logger.error(f"게시물 아카이브 중 오류 발생: {str(e)}")
+            raise
+
+    def drop_redundant_indexes(self) -> List[str]:
+        """다른 인덱스와 중복되는 인덱스 삭제"""
+        dropped = []
+        for schema in ["main"] + self.archives:
+            for name in _REDUNDANT_INDEXES:
+                exists = self.conn.execute(
+                    f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'index' AND name = ?", (name,)
+                ).fetchone()
+                if exists:
+                    self.conn.execute(f"DROP INDEX {schema}.{name}")
+                    dropped.append(f"{schema}.{name}")
+        self.conn.commit()
+        return dropped
+
+    def analyze(self):
+        """쿼리 플래너 통계 갱신 (ANALYZE 후 PRAGMA optimize)"""
+        self.conn.execute("ANALYZE")
+        self.conn.execute("PRAGMA optimize")
+        self.conn.commit()
+
+    def vacuum(self) -> int:
+        """
+        점진적 auto-vacuum을 활성화하고 빈 페이지를 반환
+
+        Returns:
+            int: 반환된 페이지 수
+        """
+        freed = 0
+        for schema in ["main"] + self.archives:
+            if self.conn.execute(f"PRAGMA {schema}.auto_vacuum").fetchone()[0] != 2:
+                # 기존 파일은 VACUUM을 해야 auto_vacuum 모드가 바뀜
+                self.conn.execute(f"PRAGMA {schema}.auto_vacuum = INCREMENTAL")
+                self.conn.execute(f"VACUUM {schema}")
+            before = self.conn.execute(f"PRAGMA {schema}.freelist_count").fetchone()[0]
+            self.conn.execute(f"PRAGMA {schema}.incremental_vacuum").fetchall()
+            freed += before
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return freed
+
+    def _update_daily_stats(self, cursor: sqlite3.Cursor, posts: Iterable[PostRecord], sign: int = 1):
+        """
+        저장된 게시물을 일별 집계 테이블에 반영
+
+        Args:
+            sign: 1이면 집계에 더하고, -1이면 뺌 (변경된 게시물의 이전 값 제거)
+        """
+        stats: Dict[str, List[int]] = {}
+        tags: Dict[Tuple[str, str], int] = {}
+        actresses: Dict[Tuple[str, str], int] = {}
+        for post in posts:
+            day = post.day
+            entry = stats.setdefault(day, [0, 0])
+            entry[0] += sign
+            entry[1] += sign * post.size_bytes
+            for tag in set(post.tags):
+                tags[(day, tag)] = tags.get((day, tag), 0) + sign
+            for name in set(post.actress):
+                actresses[(day, name)] = actresses.get((day, name), 0) + sign
+        cursor.executemany(_UPSERT_DAILY_STATS_SQL, [(day, c, s) for day, (c, s) in stats.items()])
+        cursor.executemany(
+            _UPSERT_DAILY_NAME_SQL.format(table='daily_tags', column='tag'),
+            [(day, tag, c) for (day, tag), c in tags.items()]
+        )
+        cursor.executemany(
+            _UPSERT_DAILY_NAME_SQL.format(table='daily_actresses', column='actress'),
+            [(day, name, c) for (day, name), c in actresses.items()]
+        )
+        if sign < 0:
+            days = [(day,) for day in stats]
+            for table in ('daily_stats', 'daily_tags', 'daily_actresses'):
+                cursor.executemany(f"DELETE FROM {table} WHERE day = ? AND post_count <= 0", days)
+
+    def needs_daily_stats(self) -> bool:
+        """게시물은 있는데 일별 집계가 비어 있는지 (집계 테이블이 없던 기존 DB)"""
+        return (self.conn.execute("SELECT 1 FROM daily_stats LIMIT 1").fetchone() is None
+                and self.conn.execute("SELECT 1 FROM posts_all LIMIT 1").fetchone() is not None)
+
+    def rebuild_daily_stats(self) -> int:
+        """
+        main과 아카이브의 전체 게시물로 일별 집계 테이블을 다시 생성
+
+        PostRecord로 해석할 수 없는 행(이전 버전에서 저장된 잘못된 값)은 로그를 남기고 건너뜁니다.
+
+        Returns:
+            int: 집계된 게시물 수
+        """
+        try:
+            with self.conn:
                 cursor = self.conn.cursor()
-                cursor.execute("""
-                    INSERT OR IGNORE INTO posts (
-                        url, code, title, image_url, file_size,
-                        post_date, tags, description, translated_desc, actress,
-                        download_url, scraped_at, views
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    post_data['url'],
-                    post_data['code'],
-                    post_data['title'],
-                    post_data['image_url'],
-                    post_data['file_size'],
-                    post_data['post_date'],
-                    post_data['tags'],
-                    post_data['description'],
-                    post_data.get('translated_desc', None),
-                    post_data['actress'],
-                    post_data['download_url'],
-                    post_data['scraped_at'],
-                    post_data.get('views', 0)
-                ))
-                success = cursor.rowcount > 0
-                if success:
-                    logger.info(f"게시물 추가 성공: {post_data['title']}")
-                else:
-                    logger.info(f"게시물 추가 실패 (중복): {post_data['title']}")
-                return success
+                for table in ('daily_stats', 'daily_tags', 'daily_actresses'):
+                    cursor.execute(f"DELETE FROM {table}")
+                count = skipped = 0
+                rows = self.conn.execute(f"SELECT {', '.join(POST_COLUMNS)} FROM posts_all")
+                while True:
+                    fetched = rows.fetchmany(1000)
+                    if not fetched:
+                        break
+                    batch = []
+                    for row in fetched:
+                        try:
+                            batch.append(PostRecord.from_row(row))
+                        except ValueError as e:
+                            skipped += 1
+                            logger.warning(f"집계에서 제외한 게시물: {row['url']} ({str(e)})")
+                    self._update_daily_stats(cursor, batch)
+                    count += len(batch)
+            logger.info(f"일별 집계 재생성 완료: {count}개 게시물 (제외 {skipped}개)")
+            return count
+        except sqlite3.Error as e:
+            logger.error(f"일별 집계 재생성 중 오류 발생: {str(e)}")
+            raise
+
+    def find_post_state(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        변경 감지에 필요한 값만 main과 아카이브에서 URL로 조회
+
+        Returns:
+            Optional[Dict[str, Any]]: schema, content_hash, description, translated_desc
+                (게시물이 없으면 None)
+        """
+        for schema in ["main"] + self.archives:
+            row = self.conn.execute(
+                f"SELECT content_hash, description, translated_desc FROM {schema}.posts WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is not None:
+                return dict(row, schema=schema)
+        return None
+
+    def _upsert(self, cursor: sqlite3.Cursor, post: PostRecord, state: Any = _LOOKUP) -> str:
+        """
+        트랜잭션 안에서 게시물 하나를 추가하거나 변경된 경우에만 갱신
+
+        Args:
+            state: 호출자가 이미 조회한 find_post_state() 결과 (주지 않으면 여기서 조회)
+
+        Returns:
+            str: 'inserted', 'updated', 'unchanged' 중 하나
+        """
+        if state is _LOOKUP:
+            state = self.find_post_state(post.url)
+        if state is None:
+            cursor.execute(_UPSERT_POST_SQL, post.to_row())
+            self._update_daily_stats(cursor, (post,))
+            return 'inserted'
+        if state['content_hash'] == post.content_hash:
+            return 'unchanged'
+
+        # 바뀐 게시물만 이전 값 전체를 읽어 집계 보정과 변경 이력에 사용
+        schema = state['schema']
+        row = cursor.execute(f"SELECT * FROM {schema}.posts WHERE url = ?", (post.url,)).fetchone()
+        try:
+            old = PostRecord.from_row(row)
+        except ValueError as e:
+            # 이전 버전에서 저장된 잘못된 행은 집계에 반영되지 않았으므로 빼지 않음
+            logger.warning(f"기존 게시물 값 해석 실패, 새 값으로 교체: {post.url} ({str(e)})")
+            old = None
+        # 설명이 그대로면 기존 번역 재사용
+        if not post.translated_desc and (row['description'] or "") == post.description:
+            post.translated_desc = row['translated_desc'] or ""
+        if schema == "main":
+            cursor.execute(_UPSERT_POST_SQL, post.to_row())
+        else:
+            values = dict(zip(POST_COLUMNS, post.to_row()))
+            cursor.execute(
+                _UPDATE_POST_SQL.format(schema=schema),
+                [values[c] for c in _UPDATE_COLUMNS] + [post.url]
+            )
+        if old is not None:
+            self._update_daily_stats(cursor, (old,), sign=-1)
+        self._update_daily_stats(cursor, (post,))
+        changed = post.changed_fields(old) if old is not None else list(CONTENT_FIELDS)
+        cursor.execute(
+            "INSERT INTO post_changes (url, changed_at, changed_fields, old_hash, new_hash) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (post.url, post.scraped_at.isoformat(' '), json.dumps(changed),
+             row['content_hash'], post.content_hash)
+        )
+        return 'updated'
+
+    def upsert_post(self, post: PostRecord, state: Any = _LOOKUP) -> str:
+        """
+        게시물을 추가하거나, 내용 해시가 달라진 경우에만 갱신하고 변경 이력 기록
+
+        Args:
+            state: 호출자가 이미 조회한 find_post_state() 결과 (같은 게시물을 다시 조회하지 않음)
+
+        Returns:
+            str: 'inserted', 'updated', 'unchanged' 중 하나 (오류 시 'error')
+        """
+        try:
+            with self.conn:  # 트랜잭션 컨텍스트 매니저 사용
+                status = self._upsert(self.conn.cursor(), post, state)
+            if status == 'inserted':
+                logger.info(f"게시물 추가 성공: {post.title}")
+            elif status == 'updated':
+                logger.info(f"게시물 변경 반영: {post.title}")
+            else:
+                logger.info(f"게시물 추가 실패 (중복): {post.title}")
+            return status
         except sqlite3.Error as e:
             logger.error(f"게시물 추가 중 오류 발생: {str(e)}")
-            return False
+            return 'error'
+
+    def add_post(self, post: PostRecord) -> bool:
+        """게시물 추가 (변경된 기존 게시물은 갱신)"""
+        return self.upsert_post(post) in ('inserted', 'updated')
     
+    def upsert_posts(self, posts: Iterable[PostRecord]) -> int:
+        """
+        게시물 여러 개를 하나의 트랜잭션으로 추가/갱신 (오류 시 롤백 후 예외 발생)
+
+        Returns:
+            int: 새로 추가되거나 갱신된 게시물 수
+        """
+        with self.conn:
+            cursor = self.conn.cursor()
+            written = 0
+            for post in posts:
+                if self._upsert(cursor, post) != 'unchanged':
+                    written += 1
+        logger.info(f"게시물 일괄 추가: {written}개")
+        return written
+
+    def add_posts(self, posts: Iterable[PostRecord]) -> int:
+        """
+        게시물 여러 개를 하나의 트랜잭션으로 추가 (변경된 기존 게시물은 갱신)
+
+        Returns:
+            int: 새로 추가되거나 갱신된 게시물 수
+        """
+        try:
+            return self.upsert_posts(posts)
+        except sqlite3.Error as e:
+            logger.error(f"게시물 일괄 추가 중 오류 발생: {str(e)}")
+            return 0
+
+    def get_post_changes(self, url: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """게시물 변경 이력 조회 (최신순)"""
+        try:
+            if url is None:
+                cursor = self.conn.execute(
+                    "SELECT * FROM post_changes ORDER BY id DESC LIMIT ?", (limit,)
+                )
+            else:
+                cursor = self.conn.execute(
+                    "SELECT * FROM post_changes WHERE url = ? ORDER BY id DESC LIMIT ?", (url, limit)
+                )
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"변경 이력 조회 중 오류 발생: {str(e)}")
+            return []
+
+    def get_daily_stats(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """일별 게시물 수와 용량 합계 조회 (start/end는 YYYY-MM-DD, 포함)"""
+        try:
+            cursor = self.conn.execute(
+                "SELECT day, post_count, total_size FROM daily_stats "
+                "WHERE day >= ? AND day <= ? ORDER BY day DESC",
+                (start or '0000-00-00', end or '9999-99-99')
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"일별 집계 조회 중 오류 발생: {str(e)}")
+            return []
+
+    def _get_top_names(self, table: str, column: str, start: Optional[str],
+                       end: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        """일별 이름 집계 테이블에서 기간 내 상위 항목 조회"""
+        try:
+            cursor = self.conn.execute(
+                f"SELECT {column}, SUM(post_count) AS post_count FROM {table} "
+                f"WHERE day >= ? AND day <= ? GROUP BY {column} "
+                f"ORDER BY post_count DESC, {column} LIMIT ?",
+                (start or '0000-00-00', end or '9999-99-99', limit)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"상위 항목 조회 중 오류 발생: {str(e)}")
+            return []
+
+    def get_top_tags(self, start: Optional[str] = None, end: Optional[str] = None,
+                     limit: int = 20) -> List[Dict[str, Any]]:
+        """기간 내 게시물 수 기준 상위 태그 조회"""
+        return self._get_top_names('daily_tags', 'tag', start, end, limit)
+
+    def get_top_actresses(self, start: Optional[str] = None, end: Optional[str] = None,
+                          limit: int = 20) -> List[Dict[str, Any]]:
+        """기간 내 게시물 수 기준 상위 배우 조회"""
+        return self._get_top_names('daily_actresses', 'actress', start, end, limit)
+
     def get_post_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """URL로 게시물 조회"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM posts WHERE url = ?", (url,))
+            cursor.execute("SELECT * FROM posts_all WHERE url = ?", (url,))
             row = cursor.fetchone()
             if row:
                 return dict(row)
@@ -116,21 +574,63 @@ class Database:
         """모든 게시물 조회"""
         try:
             cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM posts ORDER BY post_date DESC")
+            cursor.execute("SELECT * FROM posts_all ORDER BY post_date DESC")
             return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             logger.error(f"전체 게시물 조회 중 오류 발생: {str(e)}")
             return []
     
+    def notify_readers(self):
+        """
+        읽기 전용 조회 서비스에 데이터 갱신을 알림
+
+        스크래핑/백필/유지보수 실행이 커밋을 마친 뒤 호출하며,
+        조회 서비스는 이 표시 파일이 바뀌면 응답 캐시를 비웁니다.
+        """
+        try:
+            with open(update_marker_path(self.db_path), 'w', encoding='utf-8') as f:
+                f.write(datetime.now().isoformat(' '))
+        except OSError as e:
+            logger.warning(f"갱신 표시 파일 기록 실패: {str(e)}")
+
     def close(self):
         """데이터베이스 연결 종료"""
         try:
             if self.conn:
+                self.conn.execute("PRAGMA optimize")
                 self.conn.close()
                 logger.info("데이터베이스 연결 종료")
         except Exception as e:
             logger.error(f"데이터베이스 연결 종료 중 오류 발생: {str(e)}")
 
+def _create_posts_view(conn: sqlite3.Connection, aliases: List[str]):
+    """main과 주어진 아카이브의 posts를 합친 임시 뷰(posts_all) 생성"""
+    selects = ["SELECT * FROM main.posts"]
+    selects += [f"SELECT * FROM {alias}.posts" for alias in aliases]
+    conn.execute("DROP VIEW IF EXISTS temp.posts_all")
+    conn.execute(f"CREATE TEMP VIEW posts_all AS {' UNION ALL '.join(selects)}")
+
+def update_marker_path(db_path: str) -> str:
+    """데이터 갱신 표시 파일 경로 (DB 파일과 같은 디렉토리)"""
+    return os.path.join(os.path.dirname(db_path), "last_update")
+
+def connect_readonly(db_path: str = "database/scraper.db") -> sqlite3.Connection:
+    """
+    읽기 전용 연결을 열고 아카이브 DB를 읽기 전용으로 ATTACH한 뒤 posts_all 뷰 생성
+
+    여러 스레드에서 번갈아 쓸 수 있도록 check_same_thread=False로 엽니다.
+    """
+    conn = sqlite3.connect(f"file:{quote(os.path.abspath(db_path))}?mode=ro", uri=True,
+                           check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    aliases = []
+    archive_path = os.path.abspath(os.path.join(os.path.dirname(db_path), "archive", _ARCHIVE_FILE))
+    if os.path.exists(archive_path):
+        conn.execute(f"ATTACH DATABASE ? AS {_ARCHIVE_ALIAS}", (f"file:{quote(archive_path)}?mode=ro",))
+        aliases.append(_ARCHIVE_ALIAS)
+    _create_posts_view(conn, aliases)
+    return conn
+
 # 싱글톤 인스턴스
 _db = None
 
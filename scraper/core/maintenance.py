@@ -0,0 +1,61 @@
+"""
+데이터베이스 유지보수 모듈
+
+이 모듈은 주기적으로 실행되는 DB 유지보수 작업을 제공합니다.
+
+주요 기능:
+- 중복 인덱스 삭제
+- 오래된 게시물의 아카이브 DB(posts_archive.db) 이동
+- 일별 집계가 비어 있는 기존 DB의 집계 생성
+- 통계 갱신 (ANALYZE / PRAGMA optimize)
+- 점진적 auto-vacuum 및 체크포인트
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional
+from scraper.core.database import Database, get_db
+from scraper.utils.logger import get_logger
+
+# 기본 아카이브 기준 (일)
+DEFAULT_ARCHIVE_AFTER_DAYS = 180
+
+logger = get_logger(__name__)
+
+
+def run_maintenance(db: Optional[Database] = None, archive_after_days: Optional[int] = None) -> Dict[str, Any]:
+    """
+    DB 유지보수 작업을 순서대로 실행합니다.
+
+    Args:
+        db: 대상 Database (없으면 기본 인스턴스 사용)
+        archive_after_days: 아카이브 기준 일수 (없으면 환경변수 ARCHIVE_AFTER_DAYS 사용)
+
+    Returns:
+        Dict[str, Any]: 작업 결과 요약
+    """
+    if db is None:
+        db = get_db()
+    if archive_after_days is None:
+        archive_after_days = int(os.getenv('ARCHIVE_AFTER_DAYS', str(DEFAULT_ARCHIVE_AFTER_DAYS)))
+
+    start_time = time.time()
+    logger.info("DB 유지보수 시작")
+    result = {
+        'dropped_indexes': db.drop_redundant_indexes(),
+        'archived_posts': db.archive_old_posts(archive_after_days) if archive_after_days > 0 else 0,
+    }
+    # 집계 테이블이 없던 기존 DB는 첫 유지보수에서 한 번 채움
+    result['rebuilt_stats'] = db.rebuild_daily_stats() if db.needs_daily_stats() else 0
+    db.analyze()
+    result['freed_pages'] = db.vacuum()
+    result['archives'] = len(db.archives)
+    if result['archived_posts'] or result['rebuilt_stats']:
+        db.notify_readers()
+    result['elapsed'] = time.time() - start_time
+    logger.info(
+        f"DB 유지보수 완료: 인덱스 삭제 {len(result['dropped_indexes'])}개, "
+        f"아카이브 {result['archived_posts']}개, 반환 페이지 {result['freed_pages']}개 "
+        f"({result['elapsed']:.1f}초)"
+    )
+    return result
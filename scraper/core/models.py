@@ -0,0 +1,226 @@
+"""
+게시물 모델 모듈
+
+이 모듈은 스크래핑 파이프라인(process_card → save_post → add_post)을
+따라 전달되는 게시물 레코드를 정의합니다.
+DB 행(tuple)으로의 직렬화와 역직렬화는 이 모듈에서만 수행합니다.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+# posts 테이블 컬럼 순서 (to_row()가 반환하는 튜플 순서와 동일)
+POST_COLUMNS = (
+    'url', 'code', 'title', 'image_url', 'file_size',
+    'post_date', 'tags', 'description', 'translated_desc', 'actress',
+    'download_url', 'scraped_at', 'views', 'content_hash',
+)
+
+# 변경 감지에 사용하는 필드 (content_hash 계산 대상)
+CONTENT_FIELDS = (
+    'title', 'image_url', 'file_size', 'post_date', 'tags',
+    'description', 'actress', 'download_url',
+)
+
+# 파일 크기 단위 (예: "1.2GB", "850 MB")
+_SIZE_RE = re.compile(r'([\d.,]+)\s*([KMGT]?)i?B', re.IGNORECASE)
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+# 비어 있으면 안 되는 문자열 필드
+_REQUIRED_TEXT = ('url', 'code', 'title', 'image_url', 'file_size', 'download_url')
+
+
+def _to_datetime(value: Any, field: str) -> datetime:
+    """datetime 또는 ISO 형식 문자열을 datetime으로 변환"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    raise ValueError(f"{field} 값이 올바른 날짜가 아닙니다: {value!r}")
+
+
+def _to_names(value: Any, field: str) -> Tuple[str, ...]:
+    """문자열 목록 또는 JSON 배열 문자열을 튜플로 변환"""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        try:
+            value = json.loads(value) if value else []
+        except ValueError:
+            raise ValueError(f"{field} 값이 올바른 JSON 배열이 아닙니다: {value!r}")
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f"{field} 값은 문자열 목록이어야 합니다: {value!r}")
+    return tuple(str(name) for name in value)
+
+
+def _hash_values(values: list) -> str:
+    """CONTENT_FIELDS 순서의 값 목록으로 내용 해시 계산"""
+    data = json.dumps(values, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def row_content_hash(row: Mapping[str, Any]) -> str:
+    """
+    DB 행의 값으로 검증 없이 content_hash 계산
+
+    올바른 행은 PostRecord.from_row(row).content_hash와 같은 값을 내고,
+    PostRecord로 만들 수 없는 이전 버전의 행은 해석하지 못한 값을 그대로 사용합니다.
+    """
+    values = []
+    for field in CONTENT_FIELDS:
+        value = row[field]
+        try:
+            if field == 'post_date':
+                value = _to_datetime(value, field).isoformat(' ')
+            elif field in ('tags', 'actress'):
+                value = list(_to_names(value, field))
+        except ValueError:
+            pass
+        if field == 'description':
+            value = value or ""
+        values.append(value)
+    return _hash_values(values)
+
+
+def parse_file_size(text: str) -> int:
+    """파일 크기 문자열을 바이트 수로 변환 (해석할 수 없으면 0)"""
+    m = _SIZE_RE.search(text or "")
+    if not m:
+        return 0
+    try:
+        return int(float(m.group(1).replace(',', '')) * _SIZE_UNITS[m.group(2).upper()])
+    except ValueError:
+        return 0
+
+
+class PostRecord:
+    """
+    게시물 한 건을 나타내는 레코드
+
+    딕셔너리 대신 __slots__를 사용해 게시물당 메모리 사용량을 줄이고,
+    생성 시점에 필수 값을 검증합니다.
+
+    Attributes:
+        tags (Tuple[str, ...]): 태그 목록
+        actress (Tuple[str, ...]): 배우 목록
+        post_date (datetime): 게시일
+        scraped_at (datetime): 스크래핑 시간
+        date_text (Optional[str]): 해석하지 못한 게시일 원문 (content_hash에 post_date 대신 사용)
+    """
+
+    __slots__ = POST_COLUMNS + ('date_text',)
+
+    def __init__(
+        self,
+        url: str,
+        code: str,
+        title: str,
+        image_url: str,
+        file_size: str,
+        post_date: datetime,
+        tags: Iterable[str] = (),
+        description: str = "",
+        translated_desc: str = "",
+        actress: Iterable[str] = (),
+        download_url: str = "",
+        scraped_at: Optional[datetime] = None,
+        views: int = 0,
+        date_text: Optional[str] = None,
+    ):
+        """PostRecord 초기화 (값이 올바르지 않으면 ValueError 발생)"""
+        self.url = url
+        self.code = code
+        self.title = title
+        self.image_url = image_url
+        self.file_size = file_size
+        self.post_date = _to_datetime(post_date, 'post_date')
+        self.tags = _to_names(tags, 'tags')
+        self.description = description or ""
+        self.translated_desc = translated_desc or ""
+        self.actress = _to_names(actress, 'actress')
+        self.download_url = download_url
+        self.scraped_at = _to_datetime(scraped_at or datetime.now(), 'scraped_at')
+        self.views = int(views or 0)
+        self.date_text = date_text
+
+        for field in _REQUIRED_TEXT:
+            value = getattr(self, field)
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"{field} 값이 비어 있습니다")
+        self.content_hash = self.compute_hash()
+
+    def __repr__(self) -> str:
+        return f"PostRecord(code={self.code!r}, url={self.url!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PostRecord):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    __hash__ = None
+
+    def _content_values(self) -> list:
+        """CONTENT_FIELDS 순서의 JSON 직렬화 가능한 값 목록"""
+        values = []
+        for field in CONTENT_FIELDS:
+            value = getattr(self, field)
+            if field == 'post_date' and self.date_text is not None:
+                # 게시일을 해석하지 못해 대체한 값은 실행마다 바뀌므로 원문 사용
+                value = self.date_text
+            elif isinstance(value, datetime):
+                value = value.isoformat(' ')
+            elif isinstance(value, tuple):
+                value = list(value)
+            values.append(value)
+        return values
+
+    def compute_hash(self) -> str:
+        """CONTENT_FIELDS 값으로 계산한 내용 해시 (재스크래핑 시 변경 감지용)"""
+        return _hash_values(self._content_values())
+
+    def changed_fields(self, other: 'PostRecord') -> List[str]:
+        """other와 비교해 값이 다른 CONTENT_FIELDS 목록"""
+        return [
+            field for field, mine, theirs in zip(CONTENT_FIELDS, self._content_values(), other._content_values())
+            if mine != theirs
+        ]
+
+    @property
+    def day(self) -> str:
+        """게시일 (YYYY-MM-DD)"""
+        return self.post_date.strftime('%Y-%m-%d')
+
+    @property
+    def size_bytes(self) -> int:
+        """파일 크기 (바이트)"""
+        return parse_file_size(self.file_size)
+
+    def to_row(self) -> tuple:
+        """POST_COLUMNS 순서의 DB 행 튜플로 직렬화"""
+        return (
+            self.url,
+            self.code,
+            self.title,
+            self.image_url,
+            self.file_size,
+            self.post_date.isoformat(' '),
+            json.dumps(list(self.tags)),
+            self.description,
+            self.translated_desc,
+            json.dumps(list(self.actress), ensure_ascii=False),
+            self.download_url,
+            self.scraped_at.isoformat(' '),
+            self.views,
+            self.content_hash,
+        )
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'PostRecord':
+        """DB 행(sqlite3.Row 또는 dict)에서 PostRecord 생성 (content_hash는 다시 계산)"""
+        return cls(**{column: row[column] for column in POST_COLUMNS if column != 'content_hash'})
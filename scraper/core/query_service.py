@@ -0,0 +1,359 @@
+"""
+읽기 전용 게시물 조회 서비스 모듈
+
+이 모듈은 웹 프론트엔드가 DB 파일을 직접 열지 않고 게시물을 조회할 수 있도록
+읽기 전용 SQLite 연결 위에서 동작하는 로컬 HTTP JSON 서비스를 제공합니다.
+
+주요 기능:
+- 게시물 목록/검색/태그·배우·날짜 필터 (게시일 기준 keyset 페이지네이션)
+- 품번(code)으로 게시물 조회, 일별 집계 조회
+- 응답 LRU 캐시 (스크래퍼가 커밋 후 남기는 갱신 표시 파일이 바뀌면 비움)
+- ETag / If-None-Match 304 응답
+"""
+
+import base64
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlencode, urlparse
+from scraper.core.database import connect_readonly, update_marker_path
+from scraper.utils.logger import get_logger
+
+# 기본 설정
+DEFAULT_CACHE_SIZE = 256  # 캐시할 응답 수
+DEFAULT_CACHE_TTL = 60.0  # 갱신 표시 없이도 캐시를 비우는 주기 (초)
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# 응답에 포함하는 게시물 컬럼 (content_hash 제외)
+_POST_FIELDS = (
+    'id', 'url', 'code', 'title', 'image_url', 'file_size', 'post_date', 'tags',
+    'description', 'translated_desc', 'actress', 'download_url', 'scraped_at', 'views',
+)
+_SELECT_POSTS = f"SELECT {', '.join(_POST_FIELDS)} FROM posts_all"
+_SEARCH_FIELDS = ('code', 'title', 'description', 'translated_desc')
+
+# JSON 목록 컬럼에 특정 값이 있는지 확인 (기존 데이터의 잘못된 JSON은 빈 목록으로 취급)
+_HAS_NAME_SQL = (
+    "EXISTS (SELECT 1 FROM json_each(CASE WHEN json_valid({column}) THEN {column} ELSE '[]' END) "
+    "WHERE value = ?)"
+)
+
+logger = get_logger(__name__)
+
+
+class QueryError(Exception):
+    """잘못된 조회 요청 (HTTP 상태 코드와 함께 응답)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_day(value: Optional[str], name: str) -> Optional[date]:
+    """YYYY-MM-DD 문자열을 date로 변환"""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryError(400, f"{name}는 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+
+def _parse_limit(value: Optional[str], default: int = DEFAULT_LIMIT) -> int:
+    """limit 파라미터 변환 (1 ~ MAX_LIMIT)"""
+    if not value:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise QueryError(400, f"limit는 정수여야 합니다: {value}")
+    if not 1 <= limit <= MAX_LIMIT:
+        raise QueryError(400, f"limit는 1~{MAX_LIMIT} 사이여야 합니다: {limit}")
+    return limit
+
+
+def encode_cursor(post_date: str, post_id: int) -> str:
+    """마지막 게시물의 (게시일, id)를 다음 페이지 커서 문자열로 변환"""
+    raw = json.dumps([post_date, post_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """커서 문자열을 (게시일, id)로 변환"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value = json.loads(raw)
+        if (not isinstance(value, list) or len(value) != 2
+                or not isinstance(value[0], str) or not isinstance(value[1], int)):
+            raise ValueError(cursor)
+        return value[0], value[1]
+    except ValueError:
+        raise QueryError(400, f"잘못된 cursor입니다: {cursor}")
+
+
+def _post_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    """게시물 행을 응답용 dict로 변환 (tags, actress는 목록으로)"""
+    post = dict(row)
+    for key in ('tags', 'actress'):
+        try:
+            value = json.loads(post[key]) if post[key] else []
+        except ValueError:
+            value = [post[key]]  # 기존 데이터의 JSON이 아닌 값
+        post[key] = value if isinstance(value, list) else [value]
+    return post
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-Match 헤더 값에 ETag가 포함되는지 확인 (약한 비교)"""
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or (tag[2:] if tag.startswith('W/') else tag) == etag:
+            return True
+    return False
+
+
+class QueryService:
+    """
+    읽기 전용 게시물 조회 서비스
+
+    요청마다 연결 풀에서 읽기 전용 연결을 꺼내 쓰므로 여러 스레드에서
+    동시에 호출할 수 있습니다. 갱신 표시 파일의 수정 시각이 바뀌면 응답 캐시를
+    비우고, 아카이브 구성이 바뀌었을 수 있으므로 기존 연결도 새로 엽니다.
+
+    Attributes:
+        db_path (str): 조회할 DB 경로
+        cache_size (int): 캐시할 최대 응답 수 (0이면 캐시 사용 안 함)
+        cache_ttl (float): 캐시 최대 유지 시간 (초)
+        hits (int): 캐시 적중 수
+        misses (int): 캐시 미스 수
+    """
+
+    def __init__(self, db_path: str = "database/scraper.db", cache_size: int = DEFAULT_CACHE_SIZE,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
+        """QueryService 초기화"""
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.hits = 0
+        self.misses = 0
+        self._marker_path = update_marker_path(db_path)
+        self._version = self._read_version()
+        self._cache_started = time.monotonic()
+        # 캐시: 요청 키 -> (ETag, 본문)
+        self._cache: 'OrderedDict[str, Tuple[str, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # 유휴 연결: (연결, 연결을 연 시점의 데이터 버전)
+        self._pool: 'queue.LifoQueue[Tuple[sqlite3.Connection, int]]' = queue.LifoQueue()
+
+    def _read_version(self) -> int:
+        """갱신 표시 파일의 수정 시각 (없으면 0)"""
+        try:
+            return os.stat(self._marker_path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _refresh(self) -> int:
+        """데이터가 갱신되었거나 TTL이 지났으면 캐시를 비우고 현재 버전 반환"""
+        version = self._read_version()
+        with self._lock:
+            expired = time.monotonic() - self._cache_started > self.cache_ttl
+            if version != self._version or expired:
+                if version != self._version:
+                    logger.info("데이터 갱신 감지: 응답 캐시 초기화")
+                self._version = version
+                self._cache.clear()
+                self._cache_started = time.monotonic()
+            return self._version
+
+    def _acquire(self, version: int) -> sqlite3.Connection:
+        """풀에서 현재 버전의 연결을 꺼내거나 새로 엶"""
+        while True:
+            try:
+                conn, conn_version = self._pool.get_nowait()
+            except queue.Empty:
+                return connect_readonly(self.db_path)
+            if conn_version == version:
+                return conn
+            conn.close()
+
+    def _release(self, conn: sqlite3.Connection, version: int):
+        """연결을 풀에 반환 (그 사이 데이터가 갱신되었으면 닫음)"""
+        if version == self._version:
+            self._pool.put((conn, version))
+        else:
+            conn.close()
+
+    def close(self):
+        """풀의 연결을 모두 닫음"""
+        while True:
+            try:
+                conn, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def list_posts(self, conn: sqlite3.Connection, params: Dict[str, str]) -> Dict[str, Any]:
+        """
+        게시물 목록 조회 (게시일, id 내림차순)
+
+        Args:
+            conn: 읽기 전용 연결
+            params: q(검색어), tag, actress, date_from, date_to(YYYY-MM-DD, 포함),
+                    limit, cursor(이전 응답의 next_cursor)
+
+        Returns:
+            Dict[str, Any]: {'posts': [...], 'next_cursor': str 또는 None}
+        """
+        limit = _parse_limit(params.get('limit'))
+        date_from = _parse_day(params.get('date_from'), 'date_from')
+        date_to = _parse_day(params.get('date_to'), 'date_to')
+        where: List[str] = []
+        args: List[Any] = []
+        if params.get('q'):
+            pattern = '%' + params['q'].replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            where.append('(' + ' OR '.join(f"{f} LIKE ? ESCAPE '\\'" for f in _SEARCH_FIELDS) + ')')
+            args += [pattern] * len(_SEARCH_FIELDS)
+        for column in ('tags', 'actress'):
+            name = params.get('tag' if column == 'tags' else column)
+            if name:
+                where.append(_HAS_NAME_SQL.format(column=column))
+                args.append(name)
+        if date_from:
+            where.append("post_date >= ?")
+            args.append(date_from.isoformat())
+        if date_to:
+            where.append("post_date < ?")
+            args.append((date_to + timedelta(days=1)).isoformat())
+        if params.get('cursor'):
+            post_date, post_id = decode_cursor(params['cursor'])
+            where.append("(post_date < ? OR (post_date = ? AND id < ?))")
+            args += [post_date, post_date, post_id]
+
+        sql = _SELECT_POSTS
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY post_date DESC, id DESC LIMIT ?"
+        rows = conn.execute(sql, args + [limit + 1]).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]['post_date'], rows[-1]['id'])
+        return {'posts': [_post_to_dict(row) for row in rows], 'next_cursor': next_cursor}
+
+    def get_post(self, conn: sqlite3.Connection, code: str) -> Dict[str, Any]:
+        """품번으로 게시물 조회 (같은 품번이 여러 개면 가장 최근 게시물)"""
+        row = conn.execute(
+            f"{_SELECT_POSTS} WHERE code = ? ORDER BY post_date DESC, id DESC LIMIT 1", (code,)
+        ).fetchone()
+        if row is None:
+            raise QueryError(404, f"게시물을 찾을 수 없습니다: {code}")
+        return _post_to_dict(row)
+
+    def get_stats(self, conn: sqlite3.Connection, kind: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """일별 집계 조회 (kind: daily, tags, actresses)"""
+        start = _parse_day(params.get('start'), 'start')
+        end = _parse_day(params.get('end'), 'end')
+        args: List[Any] = [start.isoformat() if start else '0000-00-00',
+                           end.isoformat() if end else '9999-99-99']
+        if kind == 'daily':
+            sql = ("SELECT day, post_count, total_size FROM daily_stats "
+                   "WHERE day >= ? AND day <= ? ORDER BY day DESC LIMIT ?")
+        else:
+            table, column = ('daily_tags', 'tag') if kind == 'tags' else ('daily_actresses', 'actress')
+            sql = (f"SELECT {column}, SUM(post_count) AS post_count FROM {table} "
+                   f"WHERE day >= ? AND day <= ? GROUP BY {column} "
+                   f"ORDER BY post_count DESC, {column} LIMIT ?")
+        args.append(_parse_limit(params.get('limit')))
+        return [dict(row) for row in conn.execute(sql, args).fetchall()]
+
+    def _route(self, conn: sqlite3.Connection, path: str, params: Dict[str, str]) -> Any:
+        """경로에 맞는 조회 실행"""
+        parts = [unquote(p) for p in path.strip('/').split('/')]
+        if parts == ['posts']:
+            return self.list_posts(conn, params)
+        if len(parts) == 2 and parts[0] == 'posts' and parts[1]:
+            return self.get_post(conn, parts[1])
+        if len(parts) == 2 and parts[0] == 'stats' and parts[1] in ('daily', 'tags', 'actresses'):
+            return self.get_stats(conn, parts[1], params)
+        raise QueryError(404, f"알 수 없는 경로입니다: {path}")
+
+    def handle(self, target: str, if_none_match: Optional[str] = None) -> Tuple[int, Optional[str], bytes]:
+        """
+        요청 하나를 처리합니다.
+
+        Args:
+            target: 요청 경로와 쿼리 문자열 (예: /posts?tag=HD&limit=10)
+            if_none_match: If-None-Match 헤더 값
+
+        Returns:
+            Tuple[int, Optional[str], bytes]: (상태 코드, ETag, JSON 본문)
+        """
+        parsed = urlparse(target)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        key = parsed.path.rstrip('/') + '?' + urlencode(sorted(params.items()))
+        version = self._refresh()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is None:
+            try:
+                conn = self._acquire(version)
+                try:
+                    result = self._route(conn, parsed.path, params)
+                finally:
+                    self._release(conn, version)
+            except QueryError as e:
+                return e.status, None, json.dumps({'error': str(e)}, ensure_ascii=False).encode('utf-8')
+            except sqlite3.Error as e:
+                logger.error(f"조회 중 오류 발생 ({target}): {str(e)}")
+                return 500, None, json.dumps({'error': "조회 중 오류가 발생했습니다."},
+                                             ensure_ascii=False).encode('utf-8')
+            body = json.dumps(result, ensure_ascii=False).encode('utf-8')
+            cached = (f'"{hashlib.sha1(body).hexdigest()}"', body)
+            if self.cache_size > 0:
+                with self._lock:
+                    if version == self._version:  # 조회 중 갱신된 결과는 캐시하지 않음
+                        self._cache[key] = cached
+                        while len(self._cache) > self.cache_size:
+                            self._cache.popitem(last=False)
+
+        etag, body = cached
+        if if_none_match and _etag_matches(etag, if_none_match):
+            return 304, etag, b''
+        return 200, etag, body
+
+
+def make_server(service: QueryService, host: str = '127.0.0.1', port: int = 8080) -> ThreadingHTTPServer:
+    """조회 서비스를 제공하는 HTTP 서버 생성 (serve_forever()로 실행)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, etag, body = service.handle(self.path, self.headers.get('If-None-Match'))
+            self.send_response(status)
+            if etag:
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')  # 매번 ETag로 재검증
+            if status != 304:
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    return ThreadingHTTPServer((host, port), Handler)
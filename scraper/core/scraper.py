@@ -10,53 +10,124 @@
 - 데이터 추출 및 저장
 """
 
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-import json
 from scraper.utils.user_agent import get_random_user_agent
 from scraper.utils.logger import get_logger
-from scraper.core.database import get_db
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
+from scraper.core.database import Database, get_db
+from scraper.core.models import PostRecord
 import time
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import re
 from scraper.utils.trans_desc import translate_to_korean
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from urllib.parse import urljoin
 import threading
 
+# bs4, selenium, requests는 실제로 페이지를 가져올 때 import (CLI 시작 시간 단축)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 # 상수 정의
 BASE_URL = "https://onejav.com"
 WAIT_TIME = 0.3  # 페이지 로드 대기 시간
 PARSE_DELAY = 0.05  # 게시물별 파싱 간 대기 시간
 MAX_RETRIES = 3  # 최대 재시도 횟수
+REQUEST_TIMEOUT = 10  # HTTP 요청 타임아웃 (초)
 
 logger = get_logger(__name__)
 
 class Scraper:
     """웹 스크래핑을 수행하는 클래스"""
     
-    def __init__(self, target_url: str):
-        """Scraper 초기화"""
+    def __init__(self, target_url: str, use_selenium: bool = True,
+                 db: Optional[Database] = None, translate: bool = True,
+                 rate_limiter=None, base_url: Optional[str] = None):
+        """
+        Scraper 초기화
+
+        Args:
+            target_url: 스크래핑 대상 URL
+            use_selenium: False이면 Selenium 없이 HTTP 요청으로 페이지를 가져옴
+            db: 저장할 Database (없으면 처음 사용할 때 기본 인스턴스 사용)
+            translate: False이면 설명 번역을 건너뜀
+            rate_limiter: 요청(재시도 포함)마다 wait()를 호출할 요청 간격 제어 객체
+            base_url: 상대 링크와 목록 URL의 기준 URL (없으면 BASE_URL, 목업 사이트 등에서만 지정)
+        """
         self.target_url = target_url
-        self.db = get_db()
+        self.base_url = base_url or BASE_URL
+        self.use_selenium = use_selenium
+        self.translate = translate
+        self._db = db
+        self.rate_limiter = rate_limiter
+        self.fetch_time = 0.0  # 페이지 요청에 걸린 시간 합계 (초)
+        self.db_time = 0.0  # DB 저장에 걸린 시간 합계 (초)
+        self.updated_count = 0  # 내용이 바뀌어 갱신된 기존 게시물 수
+        self.translated_count = 0  # translate_to_korean 호출 수 (기존 번역 재사용 제외)
         self.lock = threading.Lock()  # 스레드 안전성을 위한 락 추가
-        
-        # Selenium WebDriver 설정
+        self.user_agent = get_random_user_agent()
+        self.driver = None  # 첫 페이지 요청 시 생성
+        self.session = None
+
+    @property
+    def db(self) -> Database:
+        """저장에 사용할 Database (파싱만 하는 작업자 프로세스는 DB를 열지 않음)"""
+        if self._db is None:
+            self._db = get_db()
+        return self._db
+
+    def _start_driver(self):
+        """Selenium WebDriver 설정"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.support.ui import WebDriverWait
+
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument(f'user-agent={get_random_user_agent()}')
+        chrome_options.add_argument(f'user-agent={self.user_agent}')
         self.driver = webdriver.Chrome(options=chrome_options)
         self.wait = WebDriverWait(self.driver, WAIT_TIME)
 
-    def get_page_with_selenium(self, url: str) -> BeautifulSoup:
+    def _wait_rate_limit(self):
+        """요청 간격 제어 (재시도를 포함한 모든 요청 직전에 호출)"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+
+    def get_page(self, url: str) -> 'BeautifulSoup':
+        """설정된 방식(Selenium 또는 HTTP)으로 페이지를 가져옴"""
+        if self.use_selenium:
+            return self.get_page_with_selenium(url)
+        return self.get_page_with_requests(url)
+
+    def get_page_with_requests(self, url: str) -> 'BeautifulSoup':
+        """requests를 사용하여 페이지를 가져옴 (JavaScript 렌더링 없음)"""
+        from bs4 import BeautifulSoup
+        if self.session is None:
+            import requests
+            self.session = requests.Session()
+            self.session.headers['User-Agent'] = self.user_agent
+        for attempt in range(MAX_RETRIES):
+            self._wait_rate_limit()
+            try:
+                print(f"🌐 페이지 요청: {url}")
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                response.raise_for_status()
+                return BeautifulSoup(response.text, 'html.parser')
+            except Exception as e:
+                print(f"⚡ 페이지 요청 실패 (시도 {attempt + 1}/{MAX_RETRIES}): {str(e)}")
+                if attempt == MAX_RETRIES - 1:
+                    raise
+                time.sleep(WAIT_TIME)
+
+    def get_page_with_selenium(self, url: str) -> 'BeautifulSoup':
         """Selenium을 사용하여 페이지를 가져옴"""
+        from bs4 import BeautifulSoup
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        if self.driver is None:
+            self._start_driver()
         for attempt in range(MAX_RETRIES):
+            self._wait_rate_limit()
             try:
                 print(f"🌐 페이지 요청: {url}")
                 self.driver.get(url)
@@ -84,26 +155,19 @@ class Scraper:
                     raise
                 time.sleep(WAIT_TIME)
 
-    def is_duplicate(self, post_data: dict) -> bool:
-        """게시물이 이미 DB에 존재하는지 확인"""
-        try:
-            existing_post = self.db.get_post_by_url(post_data['url'])
-            return existing_post is not None
-        except Exception as e:
-            print(f"⚡ 중복 체크 오류: {str(e)}")
-            return False
-
-    def process_card(self, card) -> Optional[dict]:
+    def process_card(self, card) -> Optional[PostRecord]:
         """카드에서 게시물 데이터 추출"""
         try:
             date_elem = card.find('p', class_='subtitle').find('a')
             if not date_elem:
                 return None
             post_date_str = date_elem.text.strip()
+            date_text = None
             try:
                 post_date = datetime.strptime(post_date_str, '%B %d, %Y')
             except ValueError:
                 post_date = datetime.now()
+                date_text = post_date_str  # 재스크래핑마다 내용 해시가 바뀌지 않도록 원문 보관
 
             title_elem = card.find('h5', class_='title').find('a')
             if not title_elem:
@@ -125,7 +189,7 @@ class Scraper:
 
             post_url = title_elem['href']
             if not post_url.startswith('http'):
-                post_url = f"{BASE_URL}{post_url}"
+                post_url = f"{self.base_url}{post_url}"
 
             img_elem = card.find('img', class_='image')
             if not img_elem or 'src' not in img_elem.attrs:
@@ -145,7 +209,7 @@ class Scraper:
                 return None
             download_url = download_elem['href']
             if not download_url.startswith('http'):
-                download_url = f"{BASE_URL}{download_url}"
+                download_url = f"{self.base_url}{download_url}"
 
             # description 추출
             description = ""
@@ -159,54 +223,77 @@ class Scraper:
             if panel_elem:
                 actress = [a.text.strip() for a in panel_elem.find_all('a', class_='panel-block')]
 
-            return {
-                'url': post_url,
-                'code': title,
-                'title': title,
-                'image_url': image_url,
-                'file_size': file_size,
-                'post_date': post_date,
-                'tags': json.dumps(tags),
-                'description': description,
-                'translated_desc': "",  # 번역은 나중에 수행
-                'actress': json.dumps(actress, ensure_ascii=False),
-                'download_url': download_url,
-                'scraped_at': datetime.now()
-            }
+            return PostRecord(
+                url=post_url,
+                code=title,
+                title=title,
+                image_url=image_url,
+                file_size=file_size,
+                post_date=post_date,
+                tags=tags,
+                description=description,
+                translated_desc="",  # 번역은 나중에 수행
+                actress=actress,
+                download_url=download_url,
+                scraped_at=datetime.now(),
+                date_text=date_text
+            )
         except Exception as e:
             print(f"⚡ 게시물 작업 오류: {str(e)}")
             return None
 
-    def save_post(self, post_data: dict, skip_duplicate_check: bool = False):
-        """게시물 데이터를 DB에 저장"""
+    def save_post(self, post: PostRecord):
+        """
+        게시물 데이터를 DB에 저장
+
+        이미 있는 게시물은 내용 해시가 같으면 건너뛰고, 달라졌으면 갱신합니다.
+        설명이 바뀌지 않았으면 기존 번역을 재사용합니다.
+        """
         try:
-            # 중복 체크 (skip_duplicate_check가 False일 때만)
-            if not skip_duplicate_check and self.is_duplicate(post_data):
+            # 중복 체크 (해시와 설명만 한 번 조회해 번역 전에 판단, upsert_post에도 그대로 전달)
+            existing = self.db.find_post_state(post.url)
+            if existing is not None and existing['content_hash'] == post.content_hash:
                 return False
 
             # 번역 수행
-            if post_data['description']:
+            if existing is not None and existing['description'] == post.description:
+                post.translated_desc = existing['translated_desc'] or ""
+            elif self.translate and post.description:
+                self.translated_count += 1
                 try:
-                    post_data['translated_desc'] = translate_to_korean(post_data['description'])
+                    post.translated_desc = translate_to_korean(post.description)
                     # 번역 성공 메시지는 저장 성공과 함께 출력
                 except Exception as e:
                     print(f"⚡ 번역 오류: {e}")
-                    post_data['translated_desc'] = ""
+                    post.translated_desc = ""
 
             # 저장
             with self.lock:  # 스레드 안전성을 위한 락 사용
-                if self.db.add_post(post_data):
-                    print(f"💾 저장 성공: {post_data['title']}")
+                db_start = time.perf_counter()
+                status = self.db.upsert_post(post, existing)
+                self.db_time += time.perf_counter() - db_start
+                if status == 'inserted':
+                    print(f"💾 저장 성공: {post.title}")
+                    return True
+                elif status == 'updated':
+                    self.updated_count += 1
+                    print(f"🔄 변경 반영: {post.title}")
                     return True
                 else:
-                    print(f"❗ 저장 실패: {post_data['title']}")
+                    print(f"❗ 저장 실패: {post.title}")
                     return False
         except Exception as e:
             print(f"⚡ 저장 오류: {str(e)}")
             raise
 
-    def get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
-        """다음 페이지 URL을 추출"""
+    def get_next_page_url(self, soup: 'BeautifulSoup', current_url: Optional[str] = None) -> Optional[str]:
+        """
+        다음 페이지 URL을 추출
+
+        Args:
+            soup: 현재 페이지
+            current_url: 현재 페이지 URL (주면 상대 링크를 이 URL 기준으로 해석, 없으면 /new 기준)
+        """
         try:
             pagination = soup.find('nav', class_='pagination')
             if not pagination:
@@ -217,36 +304,57 @@ class Scraper:
                 print("🏁 다음 페이지 링크 없음")
                 return None
             next_url = next_link['href']
-            if not next_url.startswith('http'):
+            if current_url:
+                next_url = urljoin(current_url, next_url)
+            elif not next_url.startswith('http'):
                 if next_url.startswith('?'):
-                    next_url = f"{BASE_URL}/new{next_url}"
+                    next_url = f"{self.base_url}/new{next_url}"
                 else:
-                    next_url = f"{BASE_URL}{next_url}"
+                    next_url = f"{self.base_url}{next_url}"
             print(f"👉 다음 페이지: {next_url}")
             return next_url
         except Exception as e:
             print(f"⚡ URL 추출 오류: {str(e)}")
         return None
 
-    def scrape_new_posts(self):
-        """새로운 게시물을 스크래핑"""
+    def scrape_new_posts(self) -> Dict[str, Any]:
+        """
+        새로운 게시물을 스크래핑
+
+        Returns:
+            Dict[str, Any]: 실행 통계 (가져온/실패한 페이지 수, 게시물 수, 요청/DB 시간 등)
+        """
         start_time = time.time()
         start_dt = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         print(f"✨ 스크래핑 시작 {start_dt}")
-        current_url = f"{BASE_URL}/new"
+        current_url = f"{self.base_url}/new"
+        self.fetch_time = 0.0
+        self.db_time = 0.0
+        self.updated_count = 0
+        self.translated_count = 0
         today = datetime.now().date()
         should_continue = True
         all_posts = []
         duplicate_count = 0
         saved_count = 0
-        skipped_check_count = 0  # 중복 체크 건너뛴 게시물 수
-        translated_count = 0  # 번역한 게시물 수
-        found_new_post = False  # 새로운 게시물 발견 여부
+        failed_pages = 0  # 재시도 후에도 가져오지 못한 페이지 수
         current_page = 1  # 현재 페이지 번호
+        fetched_pages = 0  # 가져온 페이지 수 (실패한 페이지 제외)
         
         while current_url and should_continue:
             print(f"📄 페이지 작업: {current_url}")
-            soup = self.get_page_with_selenium(current_url)
+            fetch_start = time.perf_counter()
+            try:
+                soup = self.get_page(current_url)
+            except Exception as e:
+                # 다음 페이지 URL을 알 수 없으므로 여기까지 수집한 게시물만 저장
+                failed_pages += 1
+                print(f"⚡ 페이지 작업 실패, 수집한 게시물까지만 저장합니다: {str(e)}")
+                logger.error(f"페이지 요청 실패 ({current_url}): {str(e)}")
+                break
+            finally:
+                self.fetch_time += time.perf_counter() - fetch_start
+            fetched_pages += 1
             
             cards = soup.find_all('div', class_='card mb-3')
             print(f"🧩 발견된 게시물: {len(cards)}개")
@@ -254,14 +362,14 @@ class Scraper:
             # 순서대로 게시물 데이터 추출
             page_posts = []
             for card in cards:
-                post_data = self.process_card(card)
-                if post_data:
-                    if post_data['post_date'].date() < today:
+                post = self.process_card(card)
+                if post:
+                    if post.post_date.date() < today:
                         should_continue = False
-                        print(f"⏰ 오늘 이전 게시물 발견 (페이지 {current_page}, 게시물: {post_data['title']})")
+                        print(f"⏰ 오늘 이전 게시물 발견 (페이지 {current_page}, 게시물: {post.title})")
                         break
-                    page_posts.append(post_data)
-                    print(f"📝 게시물 작업: {post_data['title']}")
+                    page_posts.append(post)
+                    print(f"📝 게시물 작업: {post.title}")
             
             all_posts.extend(page_posts)
             if not should_continue:
@@ -275,31 +383,41 @@ class Scraper:
 
         # 모든 게시물 저장 (중복 체크 수행, 역순으로 처리)
         today_post_count = len(all_posts)  # 오늘 게시물 수
-        for post_data in reversed(all_posts):  # 역순으로 처리
-            if not found_new_post:
-                if self.save_post(post_data, skip_duplicate_check=False):
-                    saved_count += 1
-                    if post_data['description']:
-                        translated_count += 1
-                    found_new_post = True
-                else:
-                    duplicate_count += 1
+        for post in reversed(all_posts):  # 역순으로 처리
+            if self.save_post(post):
+                saved_count += 1
             else:
-                if self.save_post(post_data, skip_duplicate_check=True):
-                    saved_count += 1
-                    if post_data['description']:
-                        translated_count += 1
-                    skipped_check_count += 1
+                duplicate_count += 1
         end_time = time.time()
         end_dt = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         elapsed = end_time - start_time
         print(f"🗓️ 오늘 게시물: {today_post_count}개")
-        print(f"🔁 중복 게시물: {duplicate_count}개 (중복 체크 건너뛴 게시물: {skipped_check_count}개)")
-        print(f"💾 저장된 게시물: {saved_count}개 (번역된 게시물: {translated_count}개)")
+        if failed_pages:
+            print(f"⚠️ 가져오지 못한 페이지: {failed_pages}개 (이후 페이지는 다음 실행에서 수집)")
+        print(f"🔁 중복 게시물: {duplicate_count}개")
+        print(f"💾 저장된 게시물: {saved_count}개 (변경 반영: {self.updated_count}개, 번역 요청: {self.translated_count}개)")
         print(f"🎉 스크래핑 완료 {end_dt}")
         print(f"⏳ 소요 시간: {elapsed:.1f}초")
+        if saved_count:
+            self.db.notify_readers()
+        return {
+            'pages': fetched_pages,
+            'posts': today_post_count,
+            'saved': saved_count,
+            'updated': self.updated_count,
+            'duplicates': duplicate_count,
+            'failed_pages': failed_pages,
+            'translated': self.translated_count,
+            'fetch_time': self.fetch_time,
+            'db_time': self.db_time,
+            'elapsed': elapsed,
+        }
 
     def close(self):
         """세션 종료"""
-        if hasattr(self, 'driver'):
-            self.driver.quit() 
\ No newline at end of file
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None 
\ No newline at end of file
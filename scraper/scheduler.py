@@ -39,6 +39,7 @@ from dotenv import load_dotenv
 # - 설정 값 로드
 
 import subprocess
+import threading
 
 # 환경 변수 로드
 load_dotenv()
@@ -52,13 +53,27 @@ class ScraperScheduler:
         scheduler (BackgroundScheduler): APScheduler 인스턴스
         scraper (Scraper): 스크래퍼 인스턴스
         interval_minutes (int): 스크래핑 작업 실행 간격 (분)
+        maintenance_interval_hours (int): DB 유지보수 작업 실행 간격 (시간)
+        profile (bool): 스크래핑 작업을 --profile 옵션으로 실행할지 여부
+        db_lock (threading.Lock): 스크래핑과 유지보수 작업이 동시에 DB를 쓰지 않도록 하는 락
     """
     
-    def __init__(self):
-        """ScraperScheduler 초기화"""
+    def __init__(self, profile: bool = None):
+        """
+        ScraperScheduler 초기화
+
+        Args:
+            profile: 프로파일링 여부 (없으면 환경변수 SCRAPE_PROFILE 사용)
+        """
         self.logger = get_logger('scheduler')
+        if profile is None:
+            profile = os.getenv('SCRAPE_PROFILE', '').lower() in ('1', 'true', 'yes')
+        self.profile = profile
         self.scheduler = BackgroundScheduler()
         self.interval_minutes = int(os.getenv('SCRAPE_INTERVAL_MINUTES', '60'))
+        self.maintenance_interval_hours = int(os.getenv('MAINTENANCE_INTERVAL_HOURS', '24'))
+        # VACUUM/아카이브 이동이 쓰기 락을 오래 잡으면 스크래퍼 저장이 실패하므로 두 작업을 직렬화
+        self.db_lock = threading.Lock()
 
     def start(self):
         """
@@ -75,6 +90,12 @@ class ScraperScheduler:
                 id='scrape_job',
                 replace_existing=True
             )
+            self.scheduler.add_job(
+                self.maintenance_job,
+                trigger=IntervalTrigger(hours=self.maintenance_interval_hours),
+                id='maintenance_job',
+                replace_existing=True
+            )
             
             # 스케줄러 시작
             self.scheduler.start()
@@ -92,11 +113,27 @@ class ScraperScheduler:
         """
         try:
             self.logger.info("Starting scraping job (run run_scraper.py)")
-            subprocess.run(["python", "run_scraper.py"], check=True)
+            command = ["python", "run_scraper.py"]
+            if self.profile:
+                command.append("--profile")
+            with self.db_lock:
+                subprocess.run(command, check=True)
             self.logger.info("Scraping job completed")
         except Exception as e:
             self.logger.error(f"Error in scraping job: {str(e)}")
 
+    def maintenance_job(self):
+        """
+        maintain_db.py 파일을 실행하는 함수
+        """
+        try:
+            self.logger.info("Starting maintenance job (run maintain_db.py)")
+            with self.db_lock:  # 진행 중인 스크래핑이 끝날 때까지 대기
+                subprocess.run(["python", "maintain_db.py"], check=True)
+            self.logger.info("Maintenance job completed")
+        except Exception as e:
+            self.logger.error(f"Error in maintenance job: {str(e)}")
+
     def stop(self):
         """
         스케줄러를 종료하는 함수
@@ -116,7 +153,13 @@ if __name__ == "__main__":
     스케줄러를 시작하고 프로그램이 종료될 때까지
     실행을 유지합니다.
     """
-    scheduler = ScraperScheduler()
+    import argparse
+    parser = argparse.ArgumentParser(description="스크래퍼 스케줄러")
+    parser.add_argument('--profile', action='store_true', default=None,
+                        help="스크래핑 작업마다 프로파일 결과를 logs/에 저장")
+    args = parser.parse_args()
+
+    scheduler = ScraperScheduler(profile=args.profile)
     try:
         scheduler.start()
         # 스케줄러가 계속 실행되도록 유지
@@ -0,0 +1,215 @@
+"""
+목록 사이트를 흉내 내는 로컬 테스트 서버 모듈
+
+이 모듈은 실제 사이트에 접속하지 않고 스크래퍼 전체 흐름을 측정할 수 있도록
+`process_card`와 `get_next_page_url`이 기대하는 마크업 그대로
+페이지가 나뉜 `/new` 목록을 생성합니다.
+
+주요 기능:
+- N개 페이지의 오늘 날짜 게시물 생성 (시드 고정으로 재현 가능)
+- 날짜별 목록 (/YYYY/MM/DD, 날짜마다 N개 페이지)
+- 응답 지연, 오류 응답 비율, 중복 게시물 비율 설정
+"""
+
+import html
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 게시물 생성에 사용하는 샘플 값
+_PREFIXES = ('ABP', 'SSIS', 'MIDV', 'IPX', 'STARS', 'JUR', 'FC2PPV', 'HEYZO')
+_TAGS = ('Big Tits', 'Creampie', 'Solowork', 'Drama', 'Married Woman', 'Cosplay', 'Uncensored', 'HD')
+_DATE_PATH_RE = re.compile(r'^/(\d{4})/(\d{2})/(\d{2})$')
+_ACTRESSES = ('Yua Mikami', 'Rin Hachimori', 'Mitsuri Nakano', 'Fuua Kaede', 'Ai Hongo', 'Nanami Misaki')
+
+
+class MockSite:
+    """
+    목록 사이트 목업 서버
+
+    Attributes:
+        pages (int): 생성할 페이지 수
+        per_page (int): 페이지당 게시물 수
+        latency (float): 응답 지연 시간 (초)
+        error_rate (float): 500 오류로 응답할 확률 (0~1)
+        duplicate_ratio (float): 이전 게시물을 다시 내보낼 확률 (0~1)
+        seed (int): 게시물 생성 시드
+        requests_served (int): 처리한 요청 수
+        errors_served (int): 오류로 응답한 요청 수
+    """
+
+    def __init__(self, pages: int = 10, per_page: int = 10, latency: float = 0.0,
+                 error_rate: float = 0.0, duplicate_ratio: float = 0.0, seed: int = 0,
+                 host: str = '127.0.0.1', port: int = 0):
+        """MockSite 초기화 (port가 0이면 빈 포트를 자동 선택)"""
+        self.pages = pages
+        self.per_page = per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.duplicate_ratio = duplicate_ratio
+        self.seed = seed
+        self.host = host
+        self.port = port
+        self.requests_served = 0
+        self.errors_served = 0
+        self._error_random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """서버 기준 URL"""
+        return f"http://{self.host}:{self.port}"
+
+    def _post_number(self, page: int, index: int, rng: random.Random, offset: int = 0) -> int:
+        """게시물 번호 (duplicate_ratio 확률로 이전 게시물 번호 재사용)"""
+        number = (page - 1) * self.per_page + index
+        if number > 0 and rng.random() < self.duplicate_ratio:
+            number = rng.randrange(number)
+        return offset + number
+
+    def render_card(self, number: int, post_date: datetime) -> str:
+        """게시물 카드 하나의 HTML 생성"""
+        rng = random.Random(f"{self.seed}-{number}")
+        prefix = _PREFIXES[number % len(_PREFIXES)]
+        code = f"{prefix}{100000 + number}" if prefix == 'FC2PPV' else f"{prefix}{number:03d}"
+        slug = code.lower()
+        tags = rng.sample(_TAGS, rng.randint(1, 4))
+        actresses = rng.sample(_ACTRESSES, rng.randint(0, 2))
+        size = f"{rng.uniform(0.5, 8.0):.2f}GB"
+        date_text = post_date.strftime('%B %d, %Y').replace(' 0', ' ')
+        tag_html = ''.join(
+            f'<a class="tag is-light" href="/tag/{html.escape(t)}">{html.escape(t)}</a>' for t in tags
+        )
+        actress_html = ''.join(
+            f'<a class="panel-block" href="/actress/{html.escape(a)}">{html.escape(a)}</a>' for a in actresses
+        )
+        return (
+            '<div class="card mb-3"><div class="card-content"><div class="columns">'
+            f'<div class="column"><img class="image" src="https://img.example.invalid/{slug}.jpg"></div>'
+            '<div class="column">'
+            f'<h5 class="title is-4 is-spaced"><a href="/torrent/{slug}">{code}</a>'
+            f'<span class="is-size-6 has-text-grey">{size}</span></h5>'
+            f'<p class="subtitle is-6"><a href="/{post_date:%Y/%m/%d}">{date_text}</a></p>'
+            f'<div class="tags">{tag_html}</div>'
+            f'<p class="level has-text-grey-dark">Mock description for {code}. {rng.random():.6f}</p>'
+            f'<div class="panel">{actress_html}</div>'
+            f'<a class="button is-primary is-fullwidth" title="Download .torrent" '
+            f'href="/torrent/{slug}/download/{number}/onejav.com_{slug}.torrent">Download</a>'
+            '</div></div></div></div>'
+        )
+
+    def render_page(self, page: int, post_date: Optional[datetime] = None) -> str:
+        """목록 페이지 HTML 생성 (post_date가 없으면 /new의 오늘 날짜 목록)"""
+        if post_date is None:
+            rng = random.Random(f"{self.seed}-page-{page}")
+            post_date, offset = datetime.now(), 0
+        else:
+            # 날짜 목록은 날짜마다 겹치지 않는 게시물 번호 사용
+            rng = random.Random(f"{self.seed}-{post_date:%Y%m%d}-page-{page}")
+            offset = post_date.toordinal() * self.pages * self.per_page
+        cards = [
+            self.render_card(self._post_number(page, i, rng, offset), post_date)
+            for i in range(self.per_page)
+        ]
+        pagination = '<nav class="pagination is-centered" role="navigation">'
+        if page < self.pages:
+            pagination += f'<a class="pagination-next" href="?page={page + 1}">Next</a>'
+        pagination += '</nav>'
+        return (
+            '<!DOCTYPE html><html><head><meta charset="utf-8"><title>New - mock</title></head>'
+            f'<body><section class="section"><div class="container">{"".join(cards)}{pagination}'
+            '</div></section></body></html>'
+        )
+
+    def handle(self, path: str) -> Tuple[int, str]:
+        """요청 경로에 대한 (상태 코드, 본문) 반환"""
+        with self._lock:
+            self.requests_served += 1
+            failed = self._error_random.random() < self.error_rate
+            if failed:
+                self.errors_served += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return 500, '<html><body>Internal Server Error</body></html>'
+        parsed = urlparse(path)
+        post_date = None
+        if parsed.path.rstrip('/') != '/new':
+            m = _DATE_PATH_RE.match(parsed.path.rstrip('/'))
+            if not m:
+                return 404, '<html><body>Not Found</body></html>'
+            try:
+                post_date = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            except ValueError:
+                return 404, '<html><body>Not Found</body></html>'
+        try:
+            page = int(parse_qs(parsed.query).get('page', ['1'])[0])
+        except ValueError:
+            return 404, '<html><body>Not Found</body></html>'
+        if not 1 <= page <= self.pages:
+            return 404, '<html><body>Not Found</body></html>'
+        return 200, self.render_page(page, post_date)
+
+    def start(self) -> 'MockSite':
+        """백그라운드 스레드에서 서버 시작"""
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = site.handle(self.path)
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 로그를 남기지 않음
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MockSite':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == '__main__':
+    # 단독 실행: 목업 서버만 띄워 브라우저나 run_scraper.py로 확인
+    import argparse
+    parser = argparse.ArgumentParser(description="목록 사이트 목업 서버")
+    parser.add_argument('--pages', type=int, default=10)
+    parser.add_argument('--per-page', type=int, default=10)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--duplicate-ratio', type=float, default=0)
+    args = parser.parse_args()
+    site = MockSite(args.pages, args.per_page, args.latency_ms / 1000, args.error_rate,
+                    args.duplicate_ratio, port=args.port).start()
+    print(f"🧪 목업 서버 실행 중: {site.url}/new (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
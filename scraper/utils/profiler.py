@@ -0,0 +1,113 @@
+"""
+스크래핑 실행 프로파일링 모듈
+
+이 모듈은 스크래핑 실행 한 번을 cProfile과 tracemalloc으로 측정하고,
+결과를 로그 디렉토리에 실행 ID와 함께 저장합니다.
+
+주요 기능:
+- cProfile 통계 저장 (logs/profile_<run_id>.prof, snakeviz 등으로 열람 가능)
+- tracemalloc 상위 메모리 할당 저장 (logs/profile_<run_id>_memory.txt)
+- process_card, 페이지 요청 경로, Database의 핫 함수 요약 출력
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+LOG_DIR = "logs"
+TOP_N = 5  # 요약에 표시할 함수 수
+TOP_ALLOCATIONS = 25  # 메모리 파일에 저장할 할당 위치 수
+
+# pstats 키: (파일명, 줄 번호, 함수명)
+FuncKey = Tuple[str, int, str]
+
+# 요약 그룹: (제목, 대상 함수 판별 함수)
+_SUMMARY_GROUPS: List[Tuple[str, Callable[[FuncKey], bool]]] = [
+    ("🧩 process_card", lambda key: key[2] == 'process_card'
+        and key[0].endswith(os.path.join('core', 'scraper.py'))),
+    ("🌐 페이지 요청", lambda key: key[2].startswith('get_page')
+        and key[0].endswith(os.path.join('core', 'scraper.py'))),
+    ("🗄️ Database", lambda key: key[0].endswith(os.path.join('core', 'database.py'))
+        and not key[2].startswith('<')),
+]
+
+
+def _format_func(key: FuncKey) -> str:
+    """함수 키를 '파일:줄(함수)' 형식으로 변환"""
+    filename, lineno, name = key
+    return f"{os.path.basename(filename)}:{lineno}({name})"
+
+
+def summarize(stats: pstats.Stats, top: int = TOP_N) -> str:
+    """
+    그룹별 핫 함수 요약 문자열 생성
+
+    각 그룹의 대상 함수는 누적 시간과 함께, 그 함수에서 직접 호출한
+    함수 중 시간이 많이 걸린 순서대로 표시합니다.
+    """
+    raw: Dict[FuncKey, tuple] = stats.stats  # type: ignore[attr-defined]
+    lines = []
+    for title, match in _SUMMARY_GROUPS:
+        roots = sorted((key for key in raw if match(key)), key=lambda k: raw[k][3], reverse=True)
+        if not roots:
+            continue
+        lines.append(title)
+        for root in roots[:top]:
+            cc, nc, tt, ct, _ = raw[root]
+            lines.append(f"  {ct:8.3f}s 누적 / {tt:8.3f}s 자체  {nc:6d}회  {_format_func(root)}")
+            # root가 직접 호출한 함수: callers에 root가 있는 함수 (호출 간선 기준 누적 시간)
+            callees = []
+            for key, (_, _, _, _, callers) in raw.items():
+                if root in callers:
+                    callees.append((callers[root][3], key))
+            for edge_ct, key in sorted(callees, reverse=True)[:top]:
+                lines.append(f"      └ {edge_ct:8.3f}s  {_format_func(key)}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profile_run(run_id: Optional[str] = None, log_dir: str = LOG_DIR) -> Iterator[str]:
+    """
+    with 블록 안의 실행을 프로파일링합니다.
+
+    Args:
+        run_id: 실행 ID (없으면 현재 시각으로 생성)
+        log_dir: 결과 파일을 저장할 디렉토리
+
+    Yields:
+        str: 실행 ID
+    """
+    run_id = run_id or datetime.now().strftime('%Y%m%d_%H%M%S')
+    os.makedirs(log_dir, exist_ok=True)
+    prof_path = os.path.join(log_dir, f"profile_{run_id}.prof")
+    mem_path = os.path.join(log_dir, f"profile_{run_id}_memory.txt")
+
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield run_id
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        profiler.dump_stats(prof_path)
+        top_stats = snapshot.statistics('lineno')
+        with open(mem_path, 'w', encoding='utf-8') as f:
+            f.write(f"peak: {peak / 1024 / 1024:.1f} MiB\n")
+            for stat in top_stats[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+
+        stats = pstats.Stats(profiler, stream=io.StringIO())
+        print(f"🔬 프로파일 저장: {prof_path}, {mem_path}")
+        print(summarize(stats))
+        print(f"🧠 최대 메모리 (tracemalloc): {peak / 1024 / 1024:.1f}MiB")
+        for stat in top_stats[:TOP_N]:
+            print(f"  {stat}")
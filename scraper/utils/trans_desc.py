@@ -1,7 +1,4 @@
-import requests
 import os
-from dotenv import load_dotenv
-load_dotenv()
 
 def translate_to_korean(text: str, api_key: str = None) -> str:
     """
@@ -12,8 +9,14 @@ def translate_to_korean(text: str, api_key: str = None) -> str:
     """
     if api_key is None:
         api_key = os.getenv('DEEPL_API_KEY')
+    if api_key is None:
+        # 환경변수가 아직 로드되지 않은 경우에만 .env를 읽음
+        from dotenv import load_dotenv
+        load_dotenv()
+        api_key = os.getenv('DEEPL_API_KEY')
     if not api_key:
         raise ValueError('DeepL API 키가 필요합니다. 환경변수 DEEPL_API_KEY를 설정하거나 직접 전달하세요.')
+    import requests  # 번역할 때만 import
     url = 'https://api-free.deepl.com/v2/translate'
     data = {
         'auth_key': api_key,
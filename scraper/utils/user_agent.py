@@ -4,12 +4,9 @@ User-Agent 관리 및 요청 간격 제어를 위한 유틸리티 모듈
 이 모듈은 웹 스크래핑 시 IP 차단을 방지하기 위한 기능을 제공합니다.
 - 랜덤 User-Agent 생성
 - 요청 간격 제어
+- 여러 프로세스가 공유하는 전역 요청 속도 제한
 """
 
-# 서드파티 모듈
-from fake_useragent import UserAgent
-# UserAgent: 랜덤 User-Agent 문자열 생성
-
 # Python 기본 모듈
 import random
 # random: 랜덤 숫자 생성 및 선택
@@ -17,6 +14,9 @@ import random
 import time
 # time: 시간 관련 기능 (현재 시간, 지연 등)
 
+import multiprocessing
+# multiprocessing: 프로세스 간 공유 값과 락
+
 from typing import List
 
 class UserAgentManager:
@@ -62,6 +62,33 @@ class UserAgentManager:
         
         self.last_request_time = time.time()
 
+class SharedRateLimiter:
+    """
+    여러 프로세스가 함께 지키는 전역 요청 속도 제한
+
+    다음 요청 가능 시각을 공유 메모리에 두고, 각 요청이 1/rate초씩
+    슬롯을 예약합니다. 프로세스 풀의 initializer 인자로 넘겨 공유합니다.
+
+    Attributes:
+        rate (float): 초당 최대 요청 수 (0 이하이면 제한 없음)
+    """
+
+    def __init__(self, rate: float):
+        """SharedRateLimiter 초기화"""
+        self.rate = rate
+        self._next_time = multiprocessing.Value('d', 0.0)  # 락 포함
+
+    def wait(self):
+        """다음 요청 슬롯까지 대기"""
+        if self.rate <= 0:
+            return
+        with self._next_time.get_lock():
+            now = time.time()
+            slot = max(now, self._next_time.value)
+            self._next_time.value = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
 def get_random_user_agent() -> str:
     """UserAgentManager의 get_random_user_agent 함수를 호출하는 편의 함수"""
     manager = UserAgentManager()
@@ -0,0 +1,34 @@
+import argparse
+import sys
+from scraper.core.query_service import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, QueryService, make_server
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 프론트엔드용 읽기 전용 게시물 조회 API 서버")
+    parser.add_argument('--host', default='127.0.0.1', help="바인드 주소")
+    parser.add_argument('--port', type=int, default=8080, help="포트")
+    parser.add_argument('--db', default="database/scraper.db", help="조회할 DB 경로")
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help="캐시할 최대 응답 수 (0이면 캐시 사용 안 함)")
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help="데이터 갱신이 없어도 캐시를 비우는 주기 (초)")
+    args = parser.parse_args()
+
+    service = QueryService(args.db, cache_size=args.cache_size, cache_ttl=args.cache_ttl)
+    server = make_server(service, args.host, args.port)
+    print(f"🛰️ 조회 API 실행 중: http://{args.host}:{server.server_address[1]} (Ctrl+C로 종료)")
+    print("   GET /posts, /posts/<code>, /stats/daily, /stats/tags, /stats/actresses")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        print(f"📊 캐시 적중 {service.hits}회, 미스 {service.misses}회")
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,58 @@
+"""
+백필 체크포인트를 테스트하는 스크립트
+
+목업 사이트를 대상으로 백필을 실행해 같은 작업은 완료된 샤드를 건너뛰고,
+대상/범위가 다른 작업의 체크포인트로는 실행하지 않는지 확인합니다.
+"""
+
+import os
+from datetime import date
+import pytest
+from scraper.core.backfill import backfill_job, date_shards, load_checkpoint, page_shards, run_backfill
+from scraper.core.database import Database
+from scraper.utils.mock_site import MockSite
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "scraper.db"))
+    yield database
+    database.close()
+
+
+def test_backfill_job_identity():
+    """작업 정보에 대상, 종류, 범위가 들어가고 페이지 작업에만 시작 날짜가 들어가는지 확인"""
+    pages = backfill_job("https://example.invalid/new", page_shards(1, 25, 10))
+    assert pages == {'target_url': "https://example.invalid/new", 'base_url': None, 'kind': 'pages',
+                     'range': "1-25", 'date': date.today().isoformat()}
+    dates = backfill_job("https://example.invalid/new", date_shards(date(2025, 1, 1), date(2025, 1, 3)))
+    assert dates['kind'] == 'date' and dates['range'] == "2025-01-01:2025-01-03"
+    assert 'date' not in dates
+
+
+def test_resume_and_reject_other_job(db, tmp_path):
+    """같은 작업은 완료된 샤드를 건너뛰고, 다른 작업의 체크포인트는 거부하는지 확인"""
+    checkpoint = str(tmp_path / "checkpoint.json")
+    with MockSite(pages=4, per_page=3) as site:
+        target_url = f"{site.url}/new"
+        shards = page_shards(1, 4, 2)
+        options = dict(workers=2, rate=0, checkpoint_path=checkpoint, db=db, base_url=site.url)
+
+        stats = run_backfill(target_url, shards, **options)
+        assert (stats['completed'], stats['posts'], stats['written']) == (2, 12, 12)
+        assert load_checkpoint(checkpoint, backfill_job(target_url, shards, site.url)) == \
+            {"pages:1-2", "pages:3-4"}
+
+        assert run_backfill(target_url, shards, **options)['skipped'] == 2
+        with pytest.raises(ValueError):
+            run_backfill(target_url, page_shards(1, 3, 2), **options)
+        with pytest.raises(ValueError):
+            run_backfill("http://other.invalid/new", shards, **options)
+
+        stats = run_backfill(target_url, page_shards(1, 3, 2), reset_checkpoint=True, **options)
+        assert (stats['skipped'], stats['completed'], stats['written']) == (0, 2, 0)
+    assert os.path.exists(checkpoint)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
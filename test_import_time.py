@@ -0,0 +1,63 @@
+"""
+모듈 import 시간을 점검하는 스크립트
+
+`python -X importtime`으로 CLI 진입 모듈을 import하여
+무거운 의존성(selenium, fake_useragent 등)이 로드되지 않는지,
+import 시간이 예산(IMPORT_BUDGET_MS, 기본 150ms) 안에 드는지 확인합니다.
+"""
+
+import os
+import subprocess
+import sys
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_BUDGET_MS = float(os.getenv('IMPORT_BUDGET_MS', '150'))
+
+# 모듈별로 import되면 안 되는 패키지
+FORBIDDEN_IMPORTS = {
+    'show_db': ('selenium', 'bs4', 'requests', 'fake_useragent'),
+    'maintain_db': ('selenium', 'bs4', 'requests', 'fake_useragent'),
+    'scraper.core.scraper': ('selenium', 'bs4', 'requests', 'fake_useragent'),
+}
+
+
+def measure_import(module: str):
+    """
+    새 인터프리터에서 모듈을 import하고 (누적 시간 ms, import된 모듈 목록) 반환
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    imported = {}
+    for line in result.stderr.splitlines():
+        # 형식: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        imported[parts[2].strip()] = int(parts[1]) / 1000
+    return imported.get(module, 0.0), set(imported)
+
+
+def test_import_time():
+    """CLI 진입 모듈의 import 시간과 무거운 의존성 로드 여부 확인"""
+    for module, forbidden in FORBIDDEN_IMPORTS.items():
+        elapsed_ms, imported = measure_import(module)
+        logger.info(f"{module}: {elapsed_ms:.1f}ms")
+        loaded = [name for name in forbidden
+                  if any(m == name or m.startswith(name + '.') for m in imported)]
+        assert not loaded, f"{module} import 시 불필요한 모듈 로드: {', '.join(loaded)}"
+        assert elapsed_ms <= IMPORT_BUDGET_MS, \
+            f"{module} import 시간 {elapsed_ms:.1f}ms가 예산 {IMPORT_BUDGET_MS:.0f}ms를 초과"
+
+
+if __name__ == "__main__":
+    test_import_time()
+    logger.info("모든 모듈이 import 시간 예산 안에 있습니다.")
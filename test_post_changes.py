@@ -0,0 +1,236 @@
+"""
+게시물 변경 감지 저장을 테스트하는 스크립트
+
+임시 DB에서 upsert_post의 추가/갱신/무변경 판정, 일별 집계 보정과 재생성,
+post_changes 이력, 아카이브로 옮겨진 게시물의 갱신,
+content_hash 컬럼이 없던 기존 DB의 변환을 확인합니다.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+import pytest
+from scraper.core.database import Database, _POSTS_TABLE_SQL
+from scraper.core.models import PostRecord, POST_COLUMNS
+
+
+def make_post(number: int, post_date: datetime, **overrides) -> PostRecord:
+    """테스트용 게시물 생성 (overrides로 필드 변경)"""
+    values = dict(
+        url=f"https://example.invalid/torrent/abp{number:03d}",
+        code=f"ABP-{number:03d}",
+        title=f"ABP-{number:03d}",
+        image_url=f"https://img.example.invalid/abp{number:03d}.jpg",
+        file_size="1.00GB",
+        post_date=post_date,
+        tags=["Drama", "HD"],
+        description=f"description {number}",
+        actress=["Yua Mikami"],
+        download_url=f"https://example.invalid/torrent/abp{number:03d}/download",
+    )
+    values.update(overrides)
+    return PostRecord(**values)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(str(tmp_path / "scraper.db"))
+    yield database
+    database.close()
+
+
+def daily_counts(db: Database, table: str, column: str) -> dict:
+    """일별 이름 집계 테이블을 {(day, 이름): 게시물 수}로 조회"""
+    rows = db.conn.execute(f"SELECT day, {column}, post_count FROM {table}")
+    return {(row[0], row[1]): row[2] for row in rows}
+
+
+def aggregates(db: Database) -> tuple:
+    """세 집계 테이블의 현재 값"""
+    stats = {row['day']: (row['post_count'], row['total_size']) for row in db.get_daily_stats()}
+    return (stats, daily_counts(db, 'daily_tags', 'tag'),
+            daily_counts(db, 'daily_actresses', 'actress'))
+
+
+def test_upsert_detects_changes(db):
+    """추가 → 무변경 → 변경 순서의 판정, 집계 보정, 변경 이력 확인"""
+    day = datetime(2026, 10, 1, 0, 0)
+    post = make_post(1, day)
+    assert db.upsert_post(post) == 'inserted'
+    assert db.upsert_post(make_post(1, day)) == 'unchanged'
+    assert db.get_post_changes() == []
+
+    changed = make_post(1, day, title="ABP-001 (re-upload)", file_size="2.00GB", tags=["Drama", "4K"])
+    assert db.upsert_post(changed) == 'updated'
+
+    row = db.get_post_by_url(post.url)
+    assert row['title'] == "ABP-001 (re-upload)"
+    assert row['content_hash'] == changed.content_hash
+    assert db.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0] == 1
+
+    changes = db.get_post_changes(post.url)
+    assert len(changes) == 1
+    assert changes[0]['changed_fields'] == '["title", "file_size", "tags"]'
+    assert changes[0]['old_hash'] == post.content_hash
+    assert changes[0]['new_hash'] == changed.content_hash
+
+    stats, tags, actresses = aggregates(db)
+    assert stats == {'2026-10-01': (1, 2 * 1024 ** 3)}
+    assert tags == {('2026-10-01', 'Drama'): 1, ('2026-10-01', '4K'): 1}
+    assert actresses == {('2026-10-01', 'Yua Mikami'): 1}
+
+
+def test_incremental_aggregates_match_rebuild(db):
+    """게시일/태그가 바뀌는 갱신 뒤에도 증분 집계가 전체 재생성 결과와 같은지 확인"""
+    day = datetime(2026, 10, 1)
+    db.upsert_posts([make_post(n, day + timedelta(days=n % 3)) for n in range(10)])
+    db.upsert_posts([
+        make_post(2, day + timedelta(days=5), tags=["Solowork"]),
+        make_post(3, day, actress=[]),
+        make_post(4, day, file_size="850MB"),
+    ])
+    incremental = aggregates(db)
+    db.rebuild_daily_stats()
+    assert aggregates(db) == incremental
+
+
+def test_rebuild_skips_invalid_rows(db):
+    """해석할 수 없는 행은 건너뛰고, 비어 있는 집계는 유지보수에서 채우는지 확인"""
+    from scraper.core.maintenance import run_maintenance
+    day = datetime(2026, 10, 1)
+    db.upsert_posts([make_post(1, day), make_post(2, day)])
+    expected = aggregates(db)
+    values = dict(zip(POST_COLUMNS, make_post(3, day).to_row()), file_size='')
+    with db.conn:
+        db.conn.execute(
+            f"INSERT INTO posts ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})",
+            list(values.values())
+        )
+        for table in ('daily_stats', 'daily_tags', 'daily_actresses'):
+            db.conn.execute(f"DELETE FROM {table}")
+    assert db.needs_daily_stats()
+
+    result = run_maintenance(db, archive_after_days=0)
+    assert result['rebuilt_stats'] == 2
+    assert aggregates(db) == expected
+    assert not db.needs_daily_stats()
+
+
+def test_update_archived_post(db):
+    """아카이브로 옮겨진 게시물이 main에 다시 추가되지 않고 아카이브에서 갱신되는지 확인"""
+    old_day = datetime.now() - timedelta(days=400)
+    db.upsert_posts([make_post(1, old_day), make_post(2, datetime.now())])
+    assert db.archive_old_posts(180) == 1
+    assert db.conn.execute("SELECT COUNT(*) FROM main.posts").fetchone()[0] == 1
+
+    assert db.upsert_post(make_post(1, old_day)) == 'unchanged'
+    assert db.upsert_post(make_post(1, old_day, description="edited")) == 'updated'
+
+    assert db.conn.execute("SELECT COUNT(*) FROM main.posts").fetchone()[0] == 1
+    archived = db.conn.execute("SELECT description FROM archive.posts").fetchall()
+    assert [row[0] for row in archived] == ["edited"]
+    assert len(db.get_post_changes()) == 1
+    stats, _, _ = aggregates(db)
+    assert stats[old_day.strftime('%Y-%m-%d')][0] == 1
+
+
+def test_unparsed_date_hash_is_stable():
+    """게시일을 해석하지 못한 게시물은 대체 시각과 관계없이 같은 해시를 갖는지 확인"""
+    first = make_post(1, datetime(2026, 10, 1, 9, 0), date_text="yesterday")
+    second = make_post(1, datetime(2026, 10, 2, 18, 30), date_text="yesterday")
+    assert first.content_hash == second.content_hash
+    assert make_post(1, datetime(2026, 10, 1)).content_hash != make_post(1, datetime(2026, 10, 2)).content_hash
+
+
+def test_open_legacy_db_without_content_hash(tmp_path):
+    """content_hash 컬럼이 없던 DB에 검증을 통과하지 못하는 행이 있어도 열리는지 확인"""
+    path = str(tmp_path / "scraper.db")
+    day = datetime(2026, 10, 1)
+    rows = [make_post(1, day).to_row()[:-1], make_post(2, day).to_row()[:-1]]
+    rows[1] = rows[1][:4] + ('',) + rows[1][5:]  # file_size가 빈 이전 버전의 행
+    conn = sqlite3.connect(path)
+    conn.execute(_POSTS_TABLE_SQL.format(schema='main').replace(",\n        content_hash TEXT", ""))
+    conn.executemany(
+        f"INSERT INTO posts ({', '.join(POST_COLUMNS[:-1])}) VALUES ({', '.join('?' * (len(POST_COLUMNS) - 1))})",
+        rows
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    try:
+        hashes = dict(db.conn.execute("SELECT code, content_hash FROM posts").fetchall())
+        assert hashes['ABP-001'] == make_post(1, day).content_hash
+        assert hashes['ABP-002']
+        assert db.upsert_post(make_post(1, day)) == 'unchanged'
+        assert db.upsert_post(make_post(2, day)) == 'updated'
+    finally:
+        db.close()
+
+
+def test_save_post_reuses_translation(db, monkeypatch):
+    """설명이 그대로인 갱신은 기존 번역을 재사용하고 번역 호출 수에 포함하지 않는지 확인"""
+    from scraper.core import scraper as scraper_module
+    calls = []
+    monkeypatch.setattr(scraper_module, 'translate_to_korean',
+                        lambda text: calls.append(text) or f"번역: {text}")
+    scraper = scraper_module.Scraper("http://127.0.0.1/new", use_selenium=False, db=db)
+    day = datetime(2026, 10, 1)
+
+    assert scraper.save_post(make_post(1, day)) is True
+    assert scraper.save_post(make_post(1, day)) is False
+    assert scraper.save_post(make_post(1, day, title="ABP-001 v2")) is True
+    assert calls == ["description 1"]
+    assert scraper.translated_count == 1
+    assert scraper.updated_count == 1
+    assert db.get_post_by_url(make_post(1, day).url)['translated_desc'] == "번역: description 1"
+
+
+def test_rescrape_translates_only_new_posts(db, monkeypatch):
+    """새 게시물 뒤에 오는 기존 게시물도 중복 체크를 거쳐 다시 번역하지 않는지 확인"""
+    from scraper.core import scraper as scraper_module
+    from scraper.utils.mock_site import MockSite
+    calls = []
+    monkeypatch.setattr(scraper_module, 'translate_to_korean',
+                        lambda text: calls.append(text) or f"번역: {text}")
+    with MockSite(pages=1, per_page=3) as site:
+        scraper = scraper_module.Scraper(f"{site.url}/new", use_selenium=False, db=db,
+                                         base_url=site.url)
+        try:
+            assert scraper.scrape_new_posts()['saved'] == 3
+            assert len(calls) == 3
+            # 역순 저장에서 가장 먼저 처리되는 게시물만 새 게시물로 만듦
+            with db.conn:
+                db.conn.execute("DELETE FROM posts WHERE id = 1")
+            stats = scraper.scrape_new_posts()
+        finally:
+            scraper.close()
+    assert (stats['saved'], stats['duplicates']) == (1, 2)
+    assert len(calls) == 4
+    assert stats['translated'] == 1
+
+
+def test_failed_page_is_not_counted(db, monkeypatch):
+    """재시도 후에도 실패한 페이지는 가져온 페이지 수에서 빼고, 앞 페이지 게시물은 저장하는지 확인"""
+    from scraper.core import scraper as scraper_module
+    from scraper.utils.mock_site import MockSite
+
+    class FailingSite(MockSite):
+        def handle(self, path):
+            if 'page=2' in path:
+                return 500, '<html><body>Internal Server Error</body></html>'
+            return super().handle(path)
+
+    monkeypatch.setattr(scraper_module, 'WAIT_TIME', 0)
+    with FailingSite(pages=3, per_page=2) as site:
+        scraper = scraper_module.Scraper(f"{site.url}/new", use_selenium=False, db=db,
+                                         translate=False, base_url=site.url)
+        try:
+            stats = scraper.scrape_new_posts()
+        finally:
+            scraper.close()
+    assert (stats['pages'], stats['failed_pages']) == (1, 1)
+    assert stats['saved'] == 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
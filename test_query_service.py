@@ -0,0 +1,147 @@
+"""
+읽기 전용 조회 서비스를 테스트하는 스크립트
+
+임시 DB에서 keyset 페이지네이션, 필터, ETag 304 응답,
+스크래퍼 커밋 후 응답 캐시 초기화를 확인합니다.
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta
+import pytest
+from scraper.core.database import Database
+from scraper.core.query_service import QueryService, make_server
+from test_post_changes import make_post
+
+# 게시물 수 (게시일마다 5개씩 두어 post_date가 같을 때 id 순서도 확인)
+POST_COUNT = 25
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "scraper.db")
+    db = Database(path)
+    start = datetime(2026, 10, 1)
+    db.upsert_posts([
+        make_post(n, start + timedelta(days=n // 5),
+                  tags=["Drama"] if n % 2 else ["HD"],
+                  actress=["Ai Hongo"] if n % 5 == 0 else [])
+        for n in range(POST_COUNT)
+    ])
+    db.close()
+    return path
+
+
+@pytest.fixture
+def service(db_path):
+    query_service = QueryService(db_path)
+    yield query_service
+    query_service.close()
+
+
+def get_json(service: QueryService, target: str):
+    status, _, body = service.handle(target)
+    assert status == 200, body
+    return json.loads(body)
+
+
+def test_keyset_pagination(service):
+    """next_cursor를 따라가면 모든 게시물이 한 번씩 최신순으로 나오는지 확인"""
+    seen = []
+    page = get_json(service, "/posts?limit=7")
+    while True:
+        seen += [(post['post_date'], post['id']) for post in page['posts']]
+        if page['next_cursor'] is None:
+            break
+        page = get_json(service, f"/posts?limit=7&cursor={page['next_cursor']}")
+    assert len(seen) == POST_COUNT
+    assert len(set(seen)) == POST_COUNT
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_filters(service):
+    """검색어, 태그, 배우, 날짜 필터와 품번 조회 확인"""
+    assert len(get_json(service, "/posts?tag=Drama&limit=100")['posts']) == 12
+    assert {p['code'] for p in get_json(service, "/posts?actress=Ai%20Hongo")['posts']} == \
+        {"ABP-000", "ABP-005", "ABP-010", "ABP-015", "ABP-020"}
+    assert [p['code'] for p in get_json(service, "/posts?q=ABP-013")['posts']] == ["ABP-013"]
+    dated = get_json(service, "/posts?date_from=2026-10-02&date_to=2026-10-03")['posts']
+    assert sorted(p['code'] for p in dated) == [f"ABP-{n:03d}" for n in range(5, 15)]
+
+    post = get_json(service, "/posts/ABP-007")
+    assert post['tags'] == ["Drama"]
+    assert service.handle("/posts/NOPE-001")[0] == 404
+
+
+def test_daily_stats_limit(service):
+    """일별 집계도 limit만큼 최근 날짜부터 반환하는지 확인"""
+    days = get_json(service, "/stats/daily?limit=2")
+    assert [row['day'] for row in days] == ["2026-10-05", "2026-10-04"]
+    assert len(get_json(service, "/stats/daily")) == POST_COUNT // 5
+    assert service.handle("/stats/daily?limit=500")[0] == 400
+
+
+@pytest.mark.parametrize("target", [
+    "/posts?limit=500",
+    "/posts?limit=abc",
+    "/posts?cursor=NQ==",
+    "/posts?cursor=not-base64!",
+    "/posts?date_from=2026-13-01",
+])
+def test_invalid_parameters(service, target):
+    """잘못된 파라미터는 예외 대신 400 JSON 오류로 응답하는지 확인"""
+    status, etag, body = service.handle(target)
+    assert status == 400
+    assert etag is None
+    assert 'error' in json.loads(body)
+
+
+def test_etag_not_modified(service):
+    """같은 ETag로 다시 요청하면 본문 없이 304로 응답하는지 확인"""
+    status, etag, body = service.handle("/posts?limit=5")
+    assert status == 200 and etag
+    assert service.handle("/posts?limit=5", etag) == (304, etag, b'')
+    assert service.handle("/posts?limit=5", f'W/{etag}')[0] == 304
+    assert service.handle("/posts?limit=5", '"other"') == (200, etag, body)
+
+
+def test_cache_invalidated_after_commit(service, db_path):
+    """notify_readers() 이후에는 캐시를 비우고 새 게시물을 보여주는지 확인"""
+    first = get_json(service, "/posts?limit=1")
+    get_json(service, "/posts?limit=1")
+    assert (service.hits, service.misses) == (1, 1)
+
+    db = Database(db_path)
+    db.upsert_post(make_post(999, datetime(2026, 10, 20)))
+    db.notify_readers()
+    db.close()
+
+    latest = get_json(service, "/posts?limit=1")
+    assert service.misses == 2
+    assert latest['posts'][0]['code'] == "ABP-999"
+    assert latest != first
+
+
+def test_http_server(service):
+    """HTTP 서버가 ETag 헤더와 If-None-Match 304를 처리하는지 확인"""
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/posts?limit=3"
+    try:
+        with urllib.request.urlopen(url) as response:
+            etag = response.headers['ETag']
+            assert response.headers['Content-Type'].startswith('application/json')
+            assert len(json.loads(response.read())['posts']) == 3
+        request = urllib.request.Request(url, headers={'If-None-Match': etag})
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(request)
+        assert excinfo.value.code == 304
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))